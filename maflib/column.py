@@ -7,7 +7,8 @@
                          value of the column.
 """
 import abc
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from maflib.validation import MafValidationError, MafValidationErrorType
@@ -16,6 +17,31 @@ if TYPE_CHECKING:
     from maflib.schemes import MafScheme
 
 
+def _compute_nullable_keys_and_values(
+    cls: type,
+) -> Tuple[Tuple[str, ...], Tuple[Any, ...]]:
+    """The keys and values of the column class's nullable dictionary, computed
+    (and its keys checked to be strings) once per class.  The values are shared,
+    so may be compared against but must not be used as a column's value."""
+    nullable_dict = cls.__nullable_dict__()  # type: ignore
+    if not nullable_dict:
+        return (), ()
+    for key in nullable_dict:
+        if not isinstance(key, str):
+            raise ValueError(
+                "Nullable key '%s' was not a 'str' but"
+                " instead '%s' (%s)" % (str(key), key.__class__.__name__, cls.__name__)
+            )
+    return tuple(nullable_dict.keys()), tuple(nullable_dict.values())
+
+
+# NB: typed explicitly, as mypy does not consider column classes to be hashable
+# arguments to lru_cache since they define __eq__.
+_nullable_keys_and_values: Callable[
+    [type], Tuple[Tuple[str, ...], Tuple[Any, ...]]
+] = lru_cache(maxsize=None)(_compute_nullable_keys_and_values)
+
+
 class MafColumnRecord:
     """
     A generic container for storing key and value pairs for a given column in a
@@ -43,14 +69,7 @@ class MafColumnRecord:
         self.validation_errors: List[Optional[MafValidationError]] = list()
 
         # check that all nullable keys are strings
-        if self.is_nullable():
-            for key in self.__nullable_keys__():
-                if not isinstance(key, str):
-                    raise ValueError(
-                        "Nullable key '%s' was not a 'str' but"
-                        " instead '%s' (%s)"
-                        % (str(key), key.__class__.__name__, self.__class__.__name__)
-                    )
+        _nullable_keys_and_values(self.__class__)
 
     def validate(
         self,
@@ -68,14 +87,11 @@ class MafColumnRecord:
             self.validation_errors = list()
 
         if scheme:
-
-            def add_errors(error: MafValidationError) -> None:
-                """Adds an error"""
-                self.validation_errors.append(error)
-
-            scheme_column_index: Optional[int] = scheme.column_index(name=self.key)
-            scheme_column_class: Optional[MafColumnRecord] = scheme.column_class(
-                name=self.key
+            add_errors = self.validation_errors.append
+            # NB: look up the column's index and class in the scheme at once
+            scheme_column = scheme.column_index_and_class(name=self.key)
+            scheme_column_index, scheme_column_class = (
+                scheme_column if scheme_column is not None else (None, None)
             )
 
             if scheme_column_index is None:
@@ -123,11 +139,7 @@ class MafColumnRecord:
         """
         :return: ``True`` if the value is a "null" value, ``False`` otherwise
         """
-        values = self.__nullable_values__()
-        if values is None:
-            return False
-        else:
-            return self.value in values
+        return self.value in _nullable_keys_and_values(self.__class__)[1]
 
     @classmethod
     def build(
@@ -147,19 +159,20 @@ class MafColumnRecord:
         ``ValueError`` if there was a formatting error.
         """
         if scheme:
-            scheme_column_index = scheme.column_index(name=name)
-            if scheme_column_index is None:
+            scheme_column = scheme.column_index_and_class(name=name)
+            if scheme_column is None:
                 raise KeyError(
                     "Column with name '%s' not found in scheme '%s'"
                     % (name, str(scheme))
                 )
-            elif column_index is not None and column_index is not scheme_column_index:
+            scheme_column_index, scheme_column_class = scheme_column
+            if column_index is not None and column_index != scheme_column_index:
                 raise ValueError(
                     "Mismatch column index: found '%s', expected '%s'"
                     % (str(column_index), str(scheme_column_index))
                 )
             # NB: do not pass the scheme!
-            return scheme.column_class(name=name).build(  # type: ignore
+            return scheme_column_class.build(  # type: ignore
                 name=name,
                 value=value,
                 column_index=scheme_column_index,
@@ -179,7 +192,7 @@ class MafColumnRecord:
         :return: ``True`` if this column has a possible "null" value, ``False``
         otherwise.
         """
-        return bool(cls.__nullable_values__())
+        return bool(_nullable_keys_and_values(cls)[1])
 
     @classmethod
     def __nullable_dict__(cls) -> Optional[Dict[str, Any]]:
@@ -197,8 +210,9 @@ class MafColumnRecord:
         :return: a list of values that should be treated as "null", ``None``
         otherwise.
         """
-        if cls.__nullable_dict__() is not None:
-            return list(cls.__nullable_dict__().values())  # type: ignore
+        nullable_dict = cls.__nullable_dict__()
+        if nullable_dict is not None:
+            return list(nullable_dict.values())
         else:
             return []
 
@@ -209,8 +223,9 @@ class MafColumnRecord:
         :return: a list of values that should be treated as "null", ``None``
         otherwise.
         """
-        if cls.__nullable_dict__() is not None:
-            return list(cls.__nullable_dict__().keys())  # type: ignore
+        nullable_dict = cls.__nullable_dict__()
+        if nullable_dict is not None:
+            return list(nullable_dict.keys())
         else:
             return []
 
@@ -219,10 +234,12 @@ class MafColumnRecord:
         __string_it__()"""
 
         # check to see if the value is a "nullable value"
-        nullable_dict = self.__nullable_dict__()
-        if nullable_dict is not None:
+        nullable_keys, nullable_values = _nullable_keys_and_values(self.__class__)
+        if self.value in nullable_values:
             possible_keys = [
-                key for key, value in nullable_dict.items() if value == self.value
+                key
+                for key, value in zip(nullable_keys, nullable_values)
+                if value == self.value
             ]
 
             # FIXME: Too-clever solution for grabbing first item of list without IndexError
@@ -315,9 +332,10 @@ class MafCustomColumnRecord(MafColumnRecord):
                 description=description,
                 scheme=scheme,
             )
-        nullable_dict = cls.__nullable_dict__()
-        if nullable_dict is not None and value in nullable_dict:
-            built_value = nullable_dict[value]
+        # NB: build the nullable dict again for the built value, as the
+        # cached values are shared (e.g. an empty list).
+        if value in _nullable_keys_and_values(cls)[0]:
+            built_value = cls.__nullable_dict__()[value]  # type: ignore
         else:
             built_value = cls.__build__(value=value)
         return cls(
@@ -352,8 +370,9 @@ class MafCustomColumnRecord(MafColumnRecord):
         """
         if reset_errors:
             self.validation_errors = list()
-        nullable_values = self.__nullable_values__()
-        if nullable_values is not None and self.value in nullable_values:
+        # NB: check the nullable values cached for the class, rather than
+        # building the nullable dict for every column
+        if self.value in _nullable_keys_and_values(self.__class__)[1]:
             msg = None
         else:
             msg = self.__validate__()
@@ -9,7 +9,8 @@ import abc
 import inspect
 import sys
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type, Union
 from uuid import UUID
 
 from maflib.column import MafColumnRecord, MafCustomColumnRecord
@@ -259,6 +260,23 @@ class NullableFloatColumn(NullableEmptyStringIsNone, FloatColumn):
     pass
 
 
+@lru_cache(maxsize=None)
+def _enum_members_by_name_and_value(enum_cls: Type[Enum]) -> Dict[Any, Enum]:
+    """The members of the enumeration by both their names and their values,
+    computed once per enumeration.  A value takes precedence over a name, as
+    when calling the enumeration before indexing it."""
+    members: Dict[Any, Enum] = {e.name: e for e in enum_cls}
+    members.update((e.value, e) for e in enum_cls)
+    return members
+
+
+@lru_cache(maxsize=None)
+def _enum_names_and_values(enum_cls: Type[Enum]) -> FrozenSet[Any]:
+    """The names and values of the members of the enumeration, computed once
+    per enumeration"""
+    return frozenset(_enum_members_by_name_and_value(enum_cls))
+
+
 class EnumColumn(MafCustomColumnRecord):
     """An abstract class whose value is an enumeration value."""
 
@@ -271,10 +289,22 @@ class EnumColumn(MafCustomColumnRecord):
         :return: the class that extends `Enum`.
         """
 
+    @classmethod
+    def __valid_values__(cls) -> FrozenSet[Any]:
+        """
+        :return: the names and values of the enumeration's members, from
+        which a column can be built.
+        """
+        return _enum_names_and_values(cls.__enum_class__())
+
     # FIXME: Return types depend on specific enum
     @classmethod
     def __build__(cls, value: Any) -> Any:
         enum_cls = cls.__enum_class__()
+        try:
+            return _enum_members_by_name_and_value(enum_cls)[value]
+        except (KeyError, TypeError):
+            pass
         try:
             return enum_cls(value)
         except ValueError:
@@ -309,6 +339,9 @@ class SequenceOfValuesColumn(MafCustomColumnRecord):
             raise ValueError(
                 "'%s' was not a string (was %s)" % (str(value), str(value.__class__))
             )
+        # NB: most sequences have a single value, so skip splitting those
+        if ";" not in value:
+            return [column_cls.__build__(value)]
         values = value.split(";")
         return [column_cls.__build__(val) for val in values]
 
@@ -225,9 +225,9 @@ class MafHeader(MutableMapping):
 
     ContigKey = "contigs"
 
-    SupportedVersions = [s.version() for s in all_schemes()]
+    SupportedVersions = frozenset(s.version() for s in all_schemes())
 
-    SupportedAnnotationSpecs = [s.annotation_spec() for s in all_schemes()]
+    SupportedAnnotationSpecs = frozenset(s.annotation_spec() for s in all_schemes())
 
     SupportedSortOrders = [so.name() for so in SortOrder.all()]
 
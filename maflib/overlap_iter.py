@@ -11,7 +11,7 @@ iterator.
 """
 
 from enum import Enum, unique
-from typing import Any, Callable, Iterator, List, Optional, Type, Union
+from typing import Any, Callable, List, Optional, Type, Union
 
 from maflib.locatable import Locatable
 from maflib.reader import MafReader
@@ -19,43 +19,13 @@ from maflib.record import MafRecord
 from maflib.sort_order import (
     BarcodesAndCoordinate,
     Coordinate,
-    SortOrder,
-    SortOrderKey,
+    SortOrderEnforcingIterator,
+    TSortKey,
     _BarcodesAndCoordinateKey,
+    _CoordinateKey,
 )
 from maflib.util import PeekableIterator
 
-TSortKey = Callable[[Union[MafRecord, Locatable]], SortOrderKey]
-
-
-class _SortOrderEnforcingIterator:
-    """An iterator that enforces a sort order."""
-
-    def __init__(self, _iter: Iterator, sort_order: SortOrder):
-        self._iter: Iterator = _iter
-        self._sort_f: TSortKey = sort_order.sort_key()
-        self._last_rec: Optional[Locatable] = None
-
-    def __iter__(self) -> '_SortOrderEnforcingIterator':
-        return self
-
-    def next(self) -> Optional[Locatable]:
-        """Gets the next element."""
-        return self.__next__()
-
-    def __next__(self) -> Optional[Locatable]:
-        rec = next(self._iter)
-        if self._last_rec:
-            rec_key = self._sort_f(rec)
-            last_rec_key = self._sort_f(self._last_rec)
-            if rec_key < last_rec_key:
-                raise Exception(
-                    "Records out of order\n%s\n%s" % (str(self._last_rec), str(rec))
-                )
-
-        self._last_rec = rec
-        return rec  # type: ignore
-
 
 class LocatableOverlapIterator:
     """An iterator over overlapping locatables across multiple `Locatable`s.
@@ -102,7 +72,7 @@ class LocatableOverlapIterator:
 
         self._overlap_f: Union[
             Callable[[_BarcodesAndCoordinateKey, _BarcodesAndCoordinateKey], bool],
-            Callable[[Locatable, Locatable], bool],
+            Callable[[_CoordinateKey, _CoordinateKey], bool],
         ]
         if not by_barcodes:
             _sort_order = Coordinate(fasta_index=fasta_index)
@@ -117,7 +87,7 @@ class LocatableOverlapIterator:
 
         # Trust, but verify
         _iters = [
-            _SortOrderEnforcingIterator(_iter, self._sort_order) for _iter in iters
+            SortOrderEnforcingIterator(_iter, self._sort_order) for _iter in iters
         ]
         self._iters: List[PeekableIterator] = [
             peekable_iterator_class(_iter) for _iter in _iters
@@ -136,7 +106,7 @@ class LocatableOverlapIterator:
         )
 
     @classmethod
-    def __overlaps(cls, min_key: Locatable, cur_key: Locatable) -> bool:
+    def __overlaps(cls, min_key: _CoordinateKey, cur_key: _CoordinateKey) -> bool:
         # NB: we assume that min_key.start <= cur_key.start
         # NB: ignores tumor and normal barcode
         return (
@@ -151,17 +121,17 @@ class LocatableOverlapIterator:
         """Gets the next set of overlapping locatables."""
         return self.__next__()
 
-    def __to_sort_key(self, rec: Locatable) -> Optional[Union[SortOrderKey, Locatable]]:
+    def __to_sort_key(self, rec: Locatable) -> Optional[_CoordinateKey]:
         return self._sort_key(rec) if rec else None
 
     def __next__(self) -> List[List[MafRecord]]:
         # 1. find the record with the smallest key.
-        keys: List[Optional[Union[SortOrderKey, Locatable]]] = [
+        keys: List[Optional[_CoordinateKey]] = [
             self.__to_sort_key(_iter.peek()) for _iter in self._iters
         ]
         # check that we have at least one _iter that return a non-None value
         next(iter([k for k in keys if k]))
-        min_key: Union[Locatable, SortOrderKey] = min([k for k in keys if k])  # type: ignore
+        min_key: _CoordinateKey = min([k for k in keys if k])  # type: ignore
 
         # 2. while we cannot add anymore, find all that are overlapping,
         # and add them to the list of records to be returned.  We update the
@@ -186,7 +156,7 @@ class LocatableOverlapIterator:
                         next_rec = next(_iter)
                         records[i].append(next_rec)
                         if min_key.end < keys[i].end:  # type: ignore
-                            min_key.end = keys[i].end  # type: ignore
+                            min_key = min_key.with_end(keys[i].end)  # type: ignore
                         added = True
                         keys[i] = None
 
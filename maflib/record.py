@@ -210,8 +210,7 @@ class MafRecord(MutableMapping, LocatableByAllele):
         :return: The MAF record formatted as though it would be in a MAF file.
           No newline is appended.
         """
-        records = [str(record) for record in self.__columns_list]
-        return MafRecord.ColumnSeparator.join(records)
+        return MafRecord.ColumnSeparator.join(map(str, self.__columns_list))
 
     # FIXME: Enum
     @property  # type: ignore
@@ -350,6 +349,7 @@ class MafRecord(MutableMapping, LocatableByAllele):
         line_number: Optional[int] = None,
         validation_stringency: ValidationStringency = ValidationStringency.Strict,
         logger: logging.Logger = Logger.RootLogger,
+        column_classes: Optional[List[Optional[type]]] = None,
     ) -> 'MafRecord':
         """
         Parses a record from a single tab-delimited line.
@@ -361,6 +361,9 @@ class MafRecord(MutableMapping, LocatableByAllele):
         :param validation_stringency: the optional validation stringency for
         the record
         :param logger the logger to which to write errors
+        :param column_classes: the optional class in the scheme for each of the
+        column names, so that callers parsing many lines with the same columns
+        need only look them up once.
         :return:
         """
         record = cls(
@@ -372,6 +375,13 @@ class MafRecord(MutableMapping, LocatableByAllele):
                 raise ValueError("Either column_names or scheme must be given")
             column_names = scheme.column_names()
 
+        if column_classes is None:
+            column_classes = (
+                [scheme.column_class(name=name) for name in column_names]
+                if scheme
+                else [None] * len(column_names)
+            )
+
         def add_errors(error: MafValidationError) -> None:
             record.validation_errors.append(error)
 
@@ -389,15 +399,13 @@ class MafRecord(MutableMapping, LocatableByAllele):
 
             return record
 
-        for column_index, (column_name, column_value) in enumerate(
-            zip(column_names, column_values)
-        ):
+        for column_index, (
+            column_name,
+            column_value,
+            scheme_column_class,
+        ) in enumerate(zip(column_names, column_values, column_classes)):
             column = None
 
-            scheme_column_class = (
-                scheme.column_class(name=column_name) if scheme else None
-            )
-
             # A validation error will be found later if we don't find the
             # column name
             if scheme_column_class is None:
@@ -406,7 +414,6 @@ class MafRecord(MutableMapping, LocatableByAllele):
                 )
             else:
                 try:
-                    scheme_column_class = scheme.column_class(name=column_name)  # type: ignore
                     column = scheme_column_class.build(  # type: ignore
                         name=column_name,
                         value=column_value,
@@ -3,8 +3,10 @@
 import json
 import os
 import pathlib
-import re
+import sys
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Dict, List, NamedTuple, Optional, Tuple, Type, Union
 
 from maflib.column import MafColumnRecord
@@ -114,7 +116,8 @@ def build_scheme_class(
     else:
         columns = datum.columns
 
-    name = "_".join([x.capitalize() for x in re.split(r"[-.]", datum.annotation)])
+    parts = datum.annotation.replace("-", ".").split(".")
+    name = "_".join(x.capitalize() for x in parts)
 
     if columns:
         column_dict = OrderedDict((c.name, c.cls) for c in columns)
@@ -202,60 +205,78 @@ def get_built_in_filenames(filename: str = None) -> List[str]:  # type: ignore
     return [str(p) for p in path.glob("*json")]
 
 
-def load_all_scheme_data(
-    filenames: List[str], column_types: List[Tuple[str, MafColumnRecord]]
-) -> List[SchemeDatum]:
+def load_scheme_datum(
+    filename: str, column_types_by_name: Dict[str, MafColumnRecord]
+) -> SchemeDatum:
     """
-    Load all the scheme data from the json file names
-    :param filenames: a list of filenames for the json schemes
-    :param column_types: a tuple of (name, class) for all known column types
-    :return: a list of ``SchemeDatum`` objects
+    Load the scheme data from a single json file
+    :param filename: the filename for the json scheme
+    :param column_types_by_name: a mapping from name to class for all known
+    column types
+    :return: a ``SchemeDatum`` object
     """
 
     def else_none(value: Union[list, str]) -> Union[Optional[list], Optional[str]]:
         return None if value == "None" else value
 
-    data = []
-    for filename in filenames:
-        with open(filename) as handle:
-            try:
-                json_data = json.load(handle)
-            except Exception as e:
-                raise ValueError(
-                    "Could not read from file '%s': %s" % (filename, str(e))
-                )
+    with open(filename) as handle:
+        try:
+            json_data = json.load(handle)
+        except Exception as e:
+            raise ValueError("Could not read from file '%s': %s" % (filename, str(e)))
 
-        columns = list()
-        for column in json_data["columns"]:
-            if len(column) < 2 or len(column) > 3:
-                raise ValueError(
-                    "Column did not have two or three " "elements: '%s'" % str(column)
-                )
+    columns = list()
+    for column in json_data["columns"]:
+        if len(column) < 2 or len(column) > 3:
+            raise ValueError(
+                "Column did not have two or three " "elements: '%s'" % str(column)
+            )
 
-            column_name = str(column[0])
-            column_cls = str(column[1])
-            column_desc = str(column[2]) if len(column) > 2 else ""
+        column_name = sys.intern(str(column[0]))
+        column_cls = str(column[1])
+        column_desc = str(column[2]) if len(column) > 2 else ""
 
-            cls = next(
-                (cls for cls_name, cls in column_types if cls_name == column_cls),
-                None,
+        cls = column_types_by_name.get(column_cls)
+        if not cls:
+            raise ValueError(
+                "Could not find a column type with name "
+                "'%s' for column '%s'" % (column_cls, column_name)
             )
-            if not cls:
-                raise ValueError(
-                    "Could not find a column type with name "
-                    "'%s' for column '%s'" % (column_cls, column_name)
-                )
 
-            columns.append(_Column(name=column_name, cls=cls, desc=column_desc))
-        datum = SchemeDatum(
-            version=json_data["version"],
-            annotation=json_data["annotation-spec"],
-            extends=else_none(json_data["extends"]),  # type: ignore
-            columns=columns,
-            filtered=else_none(json_data["filtered"]),  # type: ignore
-        )
-        data.append(datum)
-    return data
+        columns.append(_Column(name=column_name, cls=cls, desc=column_desc))
+    return SchemeDatum(
+        version=json_data["version"],
+        annotation=json_data["annotation-spec"],
+        extends=else_none(json_data["extends"]),  # type: ignore
+        columns=columns,
+        filtered=else_none(json_data["filtered"]),  # type: ignore
+    )
+
+
+# The minimum number of files before they are read in parallel
+_MIN_FILES_TO_LOAD_IN_PARALLEL = 3
+
+
+def load_all_scheme_data(
+    filenames: List[str], column_types: List[Tuple[str, MafColumnRecord]]
+) -> List[SchemeDatum]:
+    """
+    Load all the scheme data from the json file names.  The files are read
+    in parallel when there are enough of them; the order of the returned data
+    always matches the order of ``filenames``.
+    :param filenames: a list of filenames for the json schemes
+    :param column_types: a tuple of (name, class) for all known column types
+    :return: a list of ``SchemeDatum`` objects
+    """
+    column_types_by_name: Dict[str, MafColumnRecord] = {}
+    for cls_name, cls in column_types:
+        column_types_by_name.setdefault(cls_name, cls)
+    load = partial(load_scheme_datum, column_types_by_name=column_types_by_name)
+
+    if len(filenames) < _MIN_FILES_TO_LOAD_IN_PARALLEL:
+        return [load(filename) for filename in filenames]
+    with ThreadPoolExecutor(max_workers=min(8, len(filenames))) as executor:
+        return list(executor.map(load, filenames))
 
 
 T = List[Union[int, str]]
@@ -329,14 +350,49 @@ def load_all_schemes(
 
 __ALL_SCHEMES = []
 __LOADED_ALL_SCHEMES = False
+__SCHEMES_BY_VERSION_AND_ANNOTATION: Dict[Tuple[str, str], Type[MafScheme]] = {}
+__SCHEMES_BY_ANNOTATION: Dict[str, Type[MafScheme]] = {}
+__BASIC_SCHEMES_BY_VERSION: Dict[str, Type[MafScheme]] = {}
+
+
+def index_schemes(
+    schemes: List[Type[MafScheme]],
+) -> Tuple[
+    Dict[Tuple[str, str], Type[MafScheme]],
+    Dict[str, Type[MafScheme]],
+    Dict[str, Type[MafScheme]],
+]:
+    """Builds the lookup tables used by ``find_scheme_class``.  Returns
+    a mapping from (version, annotation) to scheme, a mapping from annotation
+    to the first scheme with that annotation, and a mapping from version to
+    the first basic scheme with that version."""
+    by_version_and_annotation: Dict[Tuple[str, str], Type[MafScheme]] = {}
+    by_annotation: Dict[str, Type[MafScheme]] = {}
+    basic_by_version: Dict[str, Type[MafScheme]] = {}
+    for scheme in schemes:
+        version = scheme.version()
+        annotation = scheme.annotation_spec()
+        by_version_and_annotation.setdefault((version, annotation), scheme)
+        by_annotation.setdefault(annotation, scheme)
+        if version == annotation:
+            basic_by_version.setdefault(version, scheme)
+    return by_version_and_annotation, by_annotation, basic_by_version
 
 
 def all_schemes(extra_filenames: Optional[List[str]] = None) -> List[Type[MafScheme]]:
     """Gets all the known schemes."""
     global __LOADED_ALL_SCHEMES
     global __ALL_SCHEMES
+    global __SCHEMES_BY_VERSION_AND_ANNOTATION
+    global __SCHEMES_BY_ANNOTATION
+    global __BASIC_SCHEMES_BY_VERSION
     if not __LOADED_ALL_SCHEMES or extra_filenames:
         __ALL_SCHEMES = load_all_schemes(extra_filenames=extra_filenames)
+        (
+            __SCHEMES_BY_VERSION_AND_ANNOTATION,
+            __SCHEMES_BY_ANNOTATION,
+            __BASIC_SCHEMES_BY_VERSION,
+        ) = index_schemes(__ALL_SCHEMES)
         __LOADED_ALL_SCHEMES = True
     return __ALL_SCHEMES
 
@@ -349,29 +405,15 @@ def find_scheme_class(
     given annotation.  If no annotation is given, find the first scheme with
     both the version and annotation matching the given version (a basic
     scheme).  Returns the class of the scheme."""
-    schemes = all_schemes()
+    all_schemes()
     if not version and not annotation:
         raise ValueError("Either version or annotation must be given")
     elif not annotation:
-        return next(
-            (
-                s
-                for s in schemes
-                if s.version() == version and s.annotation_spec() == version
-            ),
-            None,
-        )
+        return __BASIC_SCHEMES_BY_VERSION.get(version)  # type: ignore
     elif not version:
-        return next((s for s in schemes if s.annotation_spec() == annotation), None)
+        return __SCHEMES_BY_ANNOTATION.get(annotation)
     else:
-        return next(
-            (
-                s
-                for s in schemes
-                if s.version() == version and s.annotation_spec() == annotation
-            ),
-            None,
-        )
+        return __SCHEMES_BY_VERSION_AND_ANNOTATION.get((version, annotation))
 
 
 def find_scheme(
@@ -12,8 +12,9 @@ modified after being instantiated.
 * GdcV1_0_0_ProtectedScheme  the GDC v1.0.0 protected scheme
 """
 import abc
+import sys
 from collections import OrderedDict
-from typing import Iterable, List, NoReturn, Optional, Union
+from typing import Iterable, List, NoReturn, Optional, Tuple, Union
 
 from maflib.column import MafColumnRecord
 
@@ -27,21 +28,37 @@ class MafScheme:
 
     __metaclass__ = abc.ABCMeta
 
-    def __init__(self, column_dict: dict = None, column_desc: dict = None):
+    def __init__(
+        self,
+        column_dict: dict = None,
+        column_desc: dict = None,
+        empty_column_desc: bool = False,
+    ):
         """Create a new MafScheme.  If a ``column_dict`` is supplied,
-        use that one, otherwise, use the one from ``__column_dict__``."""
+        use that one, otherwise, use the one from ``__column_dict__``.  If
+        ``empty_column_desc`` is ``True``, every column has an empty
+        description and no description mapping is stored."""
         if column_dict is None:
             column_dict = self.__column_dict__()
-        if column_desc is None:
+        if empty_column_desc:
+            column_desc = OrderedDict()
+        elif column_desc is None:
             column_desc = self.__column_desc__()
+        self.__empty_column_desc = empty_column_desc
+        # NB: column names are interned so that they are shared across all
+        # scheme instances and records.
         self.__column_name_to_column_class = OrderedDict(
-            (name, cls) for name, cls in column_dict.items()
+            (sys.intern(name), cls) for name, cls in column_dict.items()
         )
         self.__column_name_to_column_index = OrderedDict(
-            (name, i) for i, (name, _) in enumerate(column_dict.items())
+            (name, i) for i, name in enumerate(self.__column_name_to_column_class)
         )
+        self.__column_name_to_column_index_and_class = {
+            name: (i, cls)
+            for i, (name, cls) in enumerate(self.__column_name_to_column_class.items())
+        }
         self.__column_name_to_column_desc = OrderedDict(
-            (name, desc) for name, desc in column_desc.items()
+            (sys.intern(name), desc) for name, desc in column_desc.items()
         )
 
     def column_class(self, name: str):  # type: ignore
@@ -52,8 +69,15 @@ class MafScheme:
         """Get the zero-based index for the column with the given name"""
         return self.__column_name_to_column_index.get(name, None)
 
+    def column_index_and_class(self, name: str) -> Optional[Tuple[int, type]]:
+        """Get the zero-based index and the class for the column with the
+        given name, with a single lookup"""
+        return self.__column_name_to_column_index_and_class.get(name, None)
+
     def column_description(self, name: str) -> Optional[str]:
         """Get the description of the column with the given name"""
+        if self.__empty_column_desc:
+            return "" if name in self.__column_name_to_column_class else None
         return self.__column_name_to_column_desc.get(name, None)
 
     def column_names(self) -> List[str]:
@@ -62,6 +86,8 @@ class MafScheme:
 
     def column_descriptions(self) -> List[str]:
         """Get description of the columns in order of column index"""
+        if self.__empty_column_desc:
+            return self.column_names()
         return list(self.__column_name_to_column_desc.keys())
 
     @classmethod
@@ -120,10 +146,11 @@ class NoRestrictionsScheme(MafScheme):
     list of column names should be ge given when constructed."""
 
     def __init__(self, column_names: Iterable[str]):
-        column_dict = OrderedDict((name, MafColumnRecord) for name in column_names)
-        column_desc = OrderedDict((name, "") for name in column_names)
+        column_dict = OrderedDict(
+            (sys.intern(name), MafColumnRecord) for name in column_names
+        )
         super(NoRestrictionsScheme, self).__init__(
-            column_dict=column_dict, column_desc=column_desc
+            column_dict=column_dict, empty_column_desc=True
         )
 
     @classmethod
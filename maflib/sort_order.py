@@ -2,7 +2,18 @@
 """
 import abc
 from functools import total_ordering
-from typing import Any, Callable, Iterator, List, NoReturn, Optional, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from maflib.locatable import Locatable
 from maflib.record import MafRecord
@@ -34,18 +45,60 @@ class SortOrderKey:
     @classmethod
     def compare(cls, this: Any, that: Any) -> int:
         """Convenience method for comparing two objects of the same type that
-        have a total ordering."""
-        if this is None and that is None:
-            return 0
-        elif this is None:
-            return 1
-        elif that is None:
-            return -1
-        else:
+        have a total ordering.  None is ordered after all other values."""
+        if this is not None and that is not None:
             return int((this > that) - (this < that))
+        return int(this is None) - int(that is None)
 
 
-TSortKey = Callable[[Union[MafRecord, Locatable]], SortOrderKey]
+# A function that returns the sort key of a record.  The keys must be picklable,
+# as the sorter pickles them when spilling records to disk.
+TSortKey = Callable[[Union[MafRecord, Locatable]], Any]
+
+
+class _NoneLast:
+    """Stands in for None in the tuple sort keys below, and is ordered after
+    all other values, as in ``SortOrderKey.compare``."""
+
+    __slots__ = ()
+
+    def __lt__(self, other: Any) -> bool:
+        return False
+
+    def __le__(self, other: Any) -> bool:
+        return other is self
+
+    def __gt__(self, other: Any) -> bool:
+        return other is not self
+
+    def __ge__(self, other: Any) -> bool:
+        return True
+
+    def __eq__(self, other: Any) -> bool:
+        return other is self
+
+    def __hash__(self) -> int:
+        return hash(None)
+
+    def __repr__(self) -> str:
+        return "None"
+
+    def __reduce__(self) -> str:
+        """Unpickles to the same instance"""
+        return "_NONE_LAST"
+
+
+_NONE_LAST = _NoneLast()
+
+
+def _none_last(value: Any) -> Any:
+    """Returns the value to put in a sort key, with None ordered last"""
+    return _NONE_LAST if value is None else value
+
+
+def _from_none_last(value: Any) -> Optional[Any]:
+    """Returns the value in a sort key, with None restored"""
+    return None if value is _NONE_LAST else value
 
 
 class SortOrder:
@@ -67,21 +120,18 @@ class SortOrder:
         """Function to generate the sort key for sorting records into this
         ordering"""
 
-    # TODO: Implement this better
     @classmethod
     def all(cls) -> List[Type['SortOrder']]:
         """Returns the known sort order classes."""
-        return [Unknown, Unsorted, BarcodesAndCoordinate, Coordinate]
+        return list(_SORT_ORDERS.values())
 
     @classmethod
     def find(cls, sort_order_name: str) -> Type['SortOrder']:
         """Returns the sort order class by name.  Throws an exception if
         none was found"""
-        sort_order = next(
-            iter([so for so in SortOrder.all() if so.name() == sort_order_name]), None
-        )
-        if not sort_order:
-            sort_orders = ", ".join([s.name() for s in SortOrder.all()])
+        sort_order = _SORT_ORDERS.get(sort_order_name)
+        if sort_order is None:
+            sort_orders = ", ".join(_SORT_ORDERS)
             raise ValueError(
                 "Could not find sort order '%s', options: %s"
                 % (sort_order_name, sort_orders)
@@ -111,38 +161,64 @@ class Unsorted(SortOrder):
         raise NotImplementedError("Sorting not supported for Unsorted order.")
 
 
-class _CoordinateKey(SortOrderKey, Locatable):
+class _CoordinateKey(tuple):
     """A little class that aids in comparing records based on chromosome,
-    start position, and end position"""
-
-    def __init__(self, record: Locatable, contigs: List[str]):
+    start position, and end position.  The key is a tuple of the three, so
+    that comparisons are performed by the built-in tuple ordering.  A value
+    that is None is stored as ``_NONE_LAST``, so that it is ordered last."""
+
+    __slots__ = ()
+
+    def __new__(
+        cls, record: Locatable, contig_index: Dict[str, int]
+    ) -> '_CoordinateKey':
+        return tuple.__new__(cls, cls._locus(record, contig_index))
+
+    @staticmethod
+    def _locus(
+        record: Locatable, contig_index: Dict[str, int]
+    ) -> Tuple[Any, Optional[int], Optional[int]]:
+        """Gets the chromosome (or its index), start, and end of the record"""
         if not issubclass(record.__class__, Locatable):
             raise ValueError(
                 "Record of type '%s' is not a subclass of "
                 "'Locatable'" % record.__class__.__name__
             )
         chromosome = record.chromosome
-        if contigs:
-            try:
-                chromosome = contigs.index(chromosome)  # type: ignore
-            except ValueError:
+        if contig_index:
+            chromosome = contig_index.get(chromosome)  # type: ignore
+            if chromosome is None:
                 raise ValueError(
                     "Could not find contig '%s' in list of contigs: %s"
-                    % (chromosome, ", ".join(contigs))
+                    % (record.chromosome, ", ".join(contig_index))
                 )
-        Locatable.__init__(self, chromosome, record.start, record.end)
+        return _none_last(chromosome), _none_last(record.start), _none_last(record.end)
+
+    @property
+    def chromosome(self) -> Any:
+        """Returns the chromosome name, or index if contigs were given"""
+        return _from_none_last(self[-3])
+
+    @property
+    def start(self) -> Optional[int]:
+        """Returns the start position"""
+        return _from_none_last(self[-2])
 
-    def __cmp__(self, other: '_CoordinateKey') -> int:  # type: ignore[override]
+    @property
+    def end(self) -> Optional[int]:
+        """Returns the end position"""
+        return _from_none_last(self[-1])
 
-        diff = self.compare(self.chromosome, other.chromosome)
-        if diff == 0:
-            diff = self.compare(self.start, other.start)
-        if diff == 0:
-            diff = self.compare(self.end, other.end)
-        return diff
+    def with_end(self, end: Optional[int]) -> '_CoordinateKey':
+        """Returns a copy of this key with the end position replaced"""
+        return tuple.__new__(self.__class__, self[:-1] + (_none_last(end),))
 
     def __str__(self) -> str:
-        return "\t".join(str(s) for s in [self.chromosome, self.start, self.end])
+        return "\t".join(str(_from_none_last(s)) for s in self)
+
+    def __reduce__(self) -> Tuple[Any, Tuple[type, tuple]]:
+        """Pickles the key as the tuple of its values"""
+        return tuple.__new__, (self.__class__, tuple(self))
 
 
 class Coordinate(SortOrder):
@@ -169,6 +245,10 @@ class Coordinate(SortOrder):
             ), "contigs must be a list, but {0} found".format(type(contigs))
             _contigs = contigs
         self._contigs: list = _contigs
+        # NB: the first occurrence of a contig defines its position
+        self._contig_index: Dict[str, int] = {}
+        for i, contig in enumerate(_contigs):
+            self._contig_index.setdefault(contig, i)
         super().__init__()
 
     @classmethod
@@ -181,37 +261,80 @@ class Coordinate(SortOrder):
 
         def key(record: Locatable) -> _CoordinateKey:
             """Gets the key"""
-            return _CoordinateKey(record=record, contigs=self._contigs)
+            return _CoordinateKey(record=record, contig_index=self._contig_index)
 
         return key
 
 
+class _ColumnValue:
+    """Gets the value of a named column from a record.  The index of the
+    column is found from the first record with the column, and then used to
+    look up the column in subsequent records, falling back to the name if the
+    column is not found at that index."""
+
+    __slots__ = ("_name", "_index")
+
+    def __init__(self, name: str):
+        self._name: str = name
+        self._index: Optional[int] = None
+
+    def __call__(self, record: MafRecord) -> Any:
+        if not isinstance(record, MafRecord):
+            return record.value(self._name)
+        if self._index is not None:
+            try:
+                column = record[self._index]
+            except KeyError:
+                column = None
+            if column is not None and column.key == self._name:
+                return column.value
+        try:
+            column = record[self._name]
+        except KeyError:
+            return None
+        self._index = column.column_index  # type: ignore
+        return column.value  # type: ignore
+
+
 class _BarcodesAndCoordinateKey(_CoordinateKey):
     """A little class that aids in comparing records based on tumor barcode,
     matched normal barcode, chromosome, start position, and end position"""
 
-    def __init__(self, record: MafRecord, contigs: List[str]):
-        self.tumor_barcode = record.value("Tumor_Sample_Barcode")
-        self.normal_barcode = record.value("Matched_Norm_Sample_Barcode")
-        super(_BarcodesAndCoordinateKey, self).__init__(record, contigs)
+    __slots__ = ()
 
-    def __cmp__(self, other: '_BarcodesAndCoordinateKey') -> int:  # type: ignore[override]
+    def __new__(
+        cls,
+        record: MafRecord,
+        contig_index: Dict[str, int],
+        tumor_barcode: Optional[_ColumnValue] = None,
+        normal_barcode: Optional[_ColumnValue] = None,
+    ) -> '_BarcodesAndCoordinateKey':
+        """
+        :param record: the record
+        :param contig_index: the index of each contig, if any
+        :param tumor_barcode: optionally gets the tumor barcode from the record
+        :param normal_barcode: optionally gets the matched normal barcode from
+        the record
+        """
+        if tumor_barcode is None:
+            tumor_barcode = _ColumnValue("Tumor_Sample_Barcode")
+        if normal_barcode is None:
+            normal_barcode = _ColumnValue("Matched_Norm_Sample_Barcode")
+        return tuple.__new__(
+            cls,
+            (_none_last(tumor_barcode(record)), _none_last(normal_barcode(record)))
+            + cls._locus(record, contig_index),
+        )
 
-        diff = self.compare(self.tumor_barcode, other.tumor_barcode)
-        if diff == 0:
-            diff = self.compare(self.normal_barcode, other.normal_barcode)
-        if diff == 0:
-            diff = super(_BarcodesAndCoordinateKey, self).__cmp__(other)
-        return diff
+    @property
+    def tumor_barcode(self) -> Optional[str]:
+        """Returns the tumor barcode"""
+        return _from_none_last(self[0])
 
-    def __str__(self) -> str:
-        return "\t".join(
-            [
-                self.tumor_barcode,
-                self.normal_barcode,
-                super(_BarcodesAndCoordinateKey, self).__str__(),
-            ]
-        )
+    @property
+    def normal_barcode(self) -> Optional[str]:
+        """Returns the matched normal barcode"""
+        return _from_none_last(self[1])
 
 
 class BarcodesAndCoordinate(Coordinate):
@@ -224,14 +347,28 @@ class BarcodesAndCoordinate(Coordinate):
     def sort_key(self) -> TSortKey:
         """Function to generate the sort key for sorting records into this
         ordering"""
+        # NB: the column indices of the barcodes are found once, and re-used
+        # across records.
+        tumor_barcode = _ColumnValue("Tumor_Sample_Barcode")
+        normal_barcode = _ColumnValue("Matched_Norm_Sample_Barcode")
 
         def key(record: MafRecord) -> _BarcodesAndCoordinateKey:
             """Gets the key"""
-            return _BarcodesAndCoordinateKey(record=record, contigs=self._contigs)
+            return _BarcodesAndCoordinateKey(
+                record=record,
+                contig_index=self._contig_index,
+                tumor_barcode=tumor_barcode,
+                normal_barcode=normal_barcode,
+            )
 
         return key  # type: ignore
 
 
+# The known sort order classes by name
+_SORT_ORDERS: Dict[str, Type[SortOrder]] = {
+    so.name(): so for so in (Unknown, Unsorted, BarcodesAndCoordinate, Coordinate)
+}
+
 SortOrderType = Optional[SortOrder]
 
 
@@ -240,6 +377,7 @@ class SortOrderChecker:
 
     def __init__(self, sort_order: SortOrderType):
         self._last_record: Optional[Locatable] = None
+        self._last_key: Any = None
         self._sort_f: Optional[TSortKey]
         try:
             self._sort_f = sort_order.sort_key()  # type: ignore
@@ -252,18 +390,16 @@ class SortOrderChecker:
         return self.__iadd__(record)
 
     def __iadd__(self, record: Locatable) -> 'SortOrderChecker':
-        if self._last_record and self._sort_f:
+        if self._sort_f:
+            # NB: the key of the previous record is kept, so only one key is
+            # created per record
             rec_key = self._sort_f(record)
-            last_rec_key = self._sort_f(self._last_record)
-            if rec_key < last_rec_key:
+            if self._last_record and rec_key < self._last_key:
                 raise ValueError(f"Records out of order: {self._last_record} {record}")
+            self._last_key = rec_key
         self._last_record = record
         return self
 
-    def __del__(self) -> None:
-        self._last_record = None
-        self._sort_f = None
-
 
 class SortOrderEnforcingIterator:
     """An iterator that enforces a sort order."""
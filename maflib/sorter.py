@@ -2,42 +2,217 @@
 """
 
 import abc
-import errno
 import gzip
 import heapq
+import io
 import os
+import pickle
 import struct
+import sys
 import tempfile
-from typing import TYPE_CHECKING, Any, Generator, List, Optional, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum, unique
+from itertools import chain
+from operator import itemgetter
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from maflib.locatable import Locatable
 from maflib.record import MafRecord
-from maflib.sort_order import SortOrder, SortOrderKey, TSortKey
+from maflib.sort_order import SortOrder, TSortKey
 from maflib.validation import ValidationStringency
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore
+
 if TYPE_CHECKING:
     from maflib.schemes import MafScheme
 
-
-class _SortEntry:
-    """A specialized tuple that contains a key used to compare entries, and a
-    serialized version of the object being sorted."""
-
-    def __init__(self, key: Any, data: Any):
-        """
-        :param key: the key used to determine the order of the objects being
-        sorted
-        :param data: the serialized version of the object being sorted
-        """
-        self.key = key
-        self.data = data
-
-    def __lt__(self, other: '_SortEntry') -> bool:
+# The size of the buffer used when reading and writing temporary files
+_SPILL_BUFFER_SIZE = 1 << 20
+
+# The header of each entry in the temporary files: the length of the pickled
+# key, the number of serialized objects with that key, and their total length
+_HEADER = struct.Struct('<iii')
+
+# The length of each serialized object, following the header and the key when
+# there is more than one object
+_LENGTH = struct.Struct('<i')
+
+# The maximum number of buffers waiting to be compressed and written to the
+# temporary files
+_MAX_PENDING_SPILL_WRITES = 4
+
+
+# The maximum number of temporary files merged at once.  Each is read through
+# its own buffer, so more are first merged into fewer, larger files.
+_MAX_MERGE_FAN_IN = 32
+
+# The approximate number of bytes of memory used for the (offset, length)
+# location of each serialized object in the scratch file, including its slots
+# in the lists of keys and locations
+_LOCATION_SIZE = sys.getsizeof((0, 0)) + 2 * sys.getsizeof(1 << 40) + 16
+
+# The number of bits used for each of the start and end positions when packing
+# coordinate keys into a single integer
+_PACKED_POSITION_BITS = 40
+
+
+def _packed_coordinate_keys(keys: List[Any]) -> Optional[List[int]]:
+    """Packs keys that are tuples of (contig index, start, end) into single
+    integers with the same ordering, or returns None if the keys are not all
+    non-negative integers in range.  NumPy and Numba are not dependencies, so
+    the packing is done with plain integers, and sorted by the built-in
+    sort."""
+    first = keys[0]
+    if not isinstance(first, tuple) or len(first) != 3:
+        return None
+    if not all(isinstance(value, int) for value in first):
+        return None
+    try:
+        packed = [
+            (contig << (2 * _PACKED_POSITION_BITS))
+            | (start << _PACKED_POSITION_BITS)
+            | end
+            for contig, start, end in keys
+        ]
+    except (TypeError, ValueError):
+        return None
+    # NB: any negative value makes the packed integer negative, while a start
+    # or end that is too large would overlap the bits of another value
+    if min(packed) < 0:
+        return None
+    for index in (1, 2):
+        if max(map(itemgetter(index), keys)) >> _PACKED_POSITION_BITS:
+            return None
+    return packed
+
+
+@unique
+class SpillCompression(Enum):
+    """The compression used for the temporary files of a sorter"""
+
+    Zstd = ".zst"
+    Gzip = ".gz"
+    Uncompressed = ".bin"
+
+    @classmethod
+    def default(cls, tmp_dir: Optional[str] = None) -> 'SpillCompression':
+        """Uncompressed if the temporary directory is on a solid state drive,
+        where writing the raw bytes is faster than compressing them.
+        Otherwise Zstd if the zstandard package is installed, or Gzip.
+
+        :param tmp_dir: the temporary directory, or None for the default
         """
-        :param other: the other object of the same type
-        :return: true if the current object should come before the other object
-        """
-        return bool(self.key < other.key)
+        if _is_on_solid_state_drive(tmp_dir or tempfile.gettempdir()):
+            return cls.Uncompressed
+        return cls.Zstd if zstandard is not None else cls.Gzip
+
+
+def _is_on_solid_state_drive(path: str) -> bool:
+    """True if the path is on a local, non-rotational block device.  Only
+    Linux is supported, so False is returned if this cannot be determined."""
+    try:
+        device = os.stat(path).st_dev
+        block = "/sys/dev/block/%d:%d" % (os.major(device), os.minor(device))
+        # NB: partitions have no queue of their own, so check their parent
+        for queue in ("queue", "../queue"):
+            rotational = os.path.join(block, queue, "rotational")
+            if os.path.exists(rotational):
+                with open(rotational) as handle:
+                    return handle.read().strip() == "0"
+    except (OSError, AttributeError):
+        pass
+    return False
+
+
+def _key_size(key: Any) -> int:
+    """The approximate number of bytes of memory used by a sort key.  The items
+    of tuple keys are included, as they are only referenced by the key once
+    the object has been serialized."""
+    size = sys.getsizeof(key)
+    if isinstance(key, tuple):
+        size += sum(map(sys.getsizeof, key))
+    return size
+
+
+def _available_memory() -> Optional[int]:
+    """The number of bytes of physical memory currently available, or None if
+    this cannot be determined.  On Linux, this includes the page cache that can
+    be reclaimed, as reported by /proc/meminfo.  Otherwise only the free memory
+    is known, which underestimates what is available."""
+    try:
+        with open("/proc/meminfo") as handle:
+            for line in handle:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _open_spill_for_writing(
+    handle: IO[bytes], compression: SpillCompression
+) -> IO[bytes]:
+    """Opens a compressed stream for writing to the given temporary file.
+    Closing the stream does not close the temporary file."""
+    if compression == SpillCompression.Uncompressed:
+        return open(  # type: ignore
+            handle.fileno(), "wb", buffering=_SPILL_BUFFER_SIZE, closefd=False
+        )
+    if compression == SpillCompression.Zstd:
+        compressor = zstandard.ZstdCompressor(level=3)
+        return compressor.stream_writer(
+            handle, write_size=_SPILL_BUFFER_SIZE, closefd=False
+        )
+    return gzip.GzipFile(fileobj=handle, mode="wb")  # type: ignore
+
+
+def _open_spill_for_reading(
+    handle: IO[bytes], compression: SpillCompression
+) -> IO[bytes]:
+    """Opens a stream for reading the data written by
+    ``_open_spill_for_writing`` to the given temporary file.  Closing the
+    stream does not close the temporary file."""
+    if compression == SpillCompression.Uncompressed:
+        # NB: memory-mapping the file and slicing entries from it was tried,
+        # but was no faster than these buffered reads, since both copy each
+        # entry once and the merge is bound by the Python work per entry.
+        return open(  # type: ignore
+            handle.fileno(), "rb", buffering=_SPILL_BUFFER_SIZE, closefd=False
+        )
+    if compression == SpillCompression.Zstd:
+        # NB: the readers of a ZstdDecompressor share its context, and all the
+        # tmp files are read at once when merging, so each needs its own.
+        reader: Union["zstandard.ZstdDecompressionReader", gzip.GzipFile]
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            handle, read_size=_SPILL_BUFFER_SIZE, closefd=False
+        )
+    else:
+        reader = gzip.GzipFile(fileobj=handle, mode="rb")
+    # NB: buffer so that reads always return the requested number of bytes,
+    # and so that the many small reads per entry are served from memory.
+    # Prefetching the next block on a background thread was tried, but was
+    # no faster, since the merge is bound by the Python work per entry and
+    # not by decompression.
+    return io.BufferedReader(reader, buffer_size=_SPILL_BUFFER_SIZE)
 
 
 class SorterCodec:
@@ -48,128 +223,66 @@ class SorterCodec:
     __metaclass__ = abc.ABCMeta
 
     @abc.abstractmethod
-    def encode(self, obj: MafRecord) -> bytearray:
-        """Encode the object into an array of bytes"""
+    def encode(self, obj: MafRecord) -> bytes:
+        """Encode the object into bytes"""
 
     @abc.abstractmethod
     def decode(self, data: bytes, start: int, length: int) -> MafRecord:
         """Decode the object from an array of bytes"""
 
 
-TNextKey = Optional[SortOrderKey]
-TNextValue = Optional[Union[Locatable, MafRecord]]
-
-
-class _SortedIterator:
-    """An iterator that consumes data from a single tmp file of sorted data and
-    produces an iterator of sorted objects."""
-
-    def __init__(self, path: str, codec: SorterCodec, key_func: TSortKey):
-        """
-        :param path: the path to the tmp file
-        :param codec: the codec used to decode
-        :param key_func: a function that creates a key used to determine the
-        order of each object
-        """
-        self._path = path
-        self._codec = codec
-        self._key_func = key_func
-        # TODO: Refactor to context manager class
-        self._handle: gzip.GzipFile = gzip.open(path, mode="rb", compresslevel=5)
-        self._next_value: TNextValue = None
-        self._next_key: TNextKey = None
-        self._closed = False
-        self.__advance()
-
-    def __advance(self) -> None:
-        """Gets the next key and value, decoding a record if necessary"""
-        if self._closed:
-            self.__clear()
-        else:
-            data = self._handle.read(size=4)
-            if data == '' or len(data) == 0:
-                self.close()
-                self.__clear()
-            else:
-                length = struct.unpack('i', data)[0]
-                data = self._handle.read(size=length)
-                self._next_value = self._codec.decode(data, 0, length)
-                self._next_key = self._key_func(self._next_value)
-
-    def __lt__(self, other: '_SortedIterator') -> bool:
-        return self.peek_key() < other.peek_key()  # type: ignore
-
-    def __iter__(self) -> '_SortedIterator':
-        return self
-
-    def peek_key(self) -> TNextKey:
-        """Gets the next record's key, None if none exists"""
-        return self._next_key
-
-    def next(self) -> TNextValue:
-        """Gets the next record in sorted order"""
-        return self.__next__()
-
-    def __next__(self) -> TNextValue:
-        if not self._next_value:
-            raise StopIteration
-        return_value = self._next_value
-        self.__advance()
-        return return_value
-
-    def __clear(self) -> None:
-        """Sets the next key and value to None"""
-        self._next_value = None
-        self._next_key = None
-
-    def close(self) -> None:
-        """Closes the underlying temporary file"""
-        if not self._closed:
-            self._handle.close()
-            self._closed = True
-
-
-class _MergingIterator:
-    """An iterator that merges objects from _SortedIterator and maintains
-    ordering"""
-
-    def __init__(self, paths: List[str], codec: SorterCodec, key_func: TSortKey):
-        """
-        :param paths: the paths to the tmp files to merge
-        :param codec: the codec used to decode
-        :param key_func: a function that creates a key used to determine the
-        order of each object
-        """
-        self._heap: list = []
-        self._iterators: List[_SortedIterator] = []
-        for path in paths:
-            s_iter = _SortedIterator(path=path, codec=codec, key_func=key_func)
-            heapq.heappush(self._heap, s_iter)
-            self._iterators.append(s_iter)
-
-    def __iter__(self) -> '_MergingIterator':
-        return self
-
-    def next(self) -> TNextValue:
-        """Gets the next record in sorted order"""
-        return self.__next__()
-
-    def __next__(self) -> TNextValue:
-        if not self._heap:
-            self.close()
-            raise StopIteration
-        s_iter = heapq.heappop(self._heap)
-        entry = s_iter.next()
-        if s_iter.peek_key():
-            heapq.heappush(self._heap, s_iter)
-        return entry  # type: ignore
-
-    def close(self) -> None:
-        """Closes all the underlying iterators"""
-        for s_iter in self._iterators:
-            s_iter.close()
-        self._iterators = []
-        self._heap = []
+def _read_entry(handle: IO[bytes], header: bytes) -> Tuple[Any, List[bytes]]:
+    """Reads the key and serialized objects of an entry, given its already
+    read header.  Raises an ``IOError`` if the file was truncated."""
+    if len(header) < _HEADER.size:
+        raise IOError("Truncated header found in the tmp file")
+    key_length, count, data_length = _HEADER.unpack(header)
+    offset = key_length if count == 1 else key_length + _LENGTH.size * count
+    length = offset + data_length
+    # NB: the handle is always buffered, and a buffered read only returns
+    # fewer bytes than asked for at the end of the file, so there is no need
+    # to loop over partial reads from the decompressor here.
+    chunk = handle.read(length)
+    if len(chunk) < length:
+        raise IOError(
+            "Expected '%d' bytes but found '%d' in the tmp file" % (length, len(chunk))
+        )
+    key = pickle.loads(chunk[:key_length])
+    if count == 1:
+        return key, [chunk[offset:]]
+    datas = []
+    for data_length in struct.unpack_from("<%di" % count, chunk, key_length):
+        datas.append(chunk[offset : offset + data_length])
+        offset += data_length
+    return key, datas
+
+
+def _read_sorted(
+    spill: IO[bytes], compression: SpillCompression
+) -> Generator[Tuple[Any, List[bytes]], None, None]:
+    """A generator that consumes data from a single tmp file of sorted data
+    and produces the key and serialized objects for each entry, in sorted
+    order.  The tmp file is read from its start, and is left open when the
+    generator is exhausted or closed.
+
+    :param spill: the tmp file
+    :param compression: the compression of the tmp file
+    """
+    spill.seek(0)
+    # NB: the tmp file is read sequentially, so ask for more read-ahead
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(spill.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    handle: IO[bytes] = _open_spill_for_reading(spill, compression)
+    read = handle.read
+    header_size = _HEADER.size
+    try:
+        while True:
+            header = read(header_size)
+            if not header:
+                break
+            yield _read_entry(handle, header)
+    finally:
+        handle.close()
 
 
 class MafSorterCodec(SorterCodec):
@@ -180,32 +293,67 @@ class MafSorterCodec(SorterCodec):
         column_names: Optional[list] = None,
         scheme: Optional['MafScheme'] = None,
         validation_stringency: ValidationStringency = ValidationStringency.Strict,
+        pass_through: bool = False,
     ):
         # NB: if neither column_names nor scheme are given, then encode must be
         # called once before decode, and then the column names from the first
         # record are used.
         self._column_names = column_names
         self._scheme = scheme
+        # NB: the scheme's class for each column is looked up on the first
+        # call to from_line, rather than for every record.
+        self._column_classes: Optional[List[Optional[type]]] = None
         self.validation_stringency = validation_stringency
+        # NB: if pass_through is true, decode returns the line for the record
+        # rather than parsing it into a MafRecord.
+        self._pass_through = pass_through
 
-    def encode(self, record: MafRecord) -> bytearray:
+    def encode(self, record: MafRecord) -> bytes:
         """Encodes a MafRecord"""
         if not self._column_names:
             self._column_names = record.keys()  # type: ignore
-        return bytearray(source=str(record), encoding='utf-8')  # type: ignore
+        return str(record).encode('utf-8')
 
     def decode(self, data: bytes, start: int, length: int) -> MafRecord:
-        """Decodes the data and re-parses the text, returning a MafRecord"""
+        """Decodes the data and re-parses the text, returning a MafRecord, or
+        the line itself if the codec passes through lines"""
         end = start + length
         line = data[start:end].decode('utf-8')
+        if self._pass_through:
+            return line  # type: ignore
+        return self.from_line(line)
+
+    def from_line(self, line: str) -> MafRecord:
+        """Parses the line returned by decode when passing through lines"""
+        if self._column_classes is None and self._scheme is not None:
+            column_names = self._column_names or self._scheme.column_names()
+            self._column_classes = [
+                self._scheme.column_class(name=name) for name in column_names
+            ]
         return MafRecord.from_line(
             line=line,
             column_names=self._column_names,
             scheme=self._scheme,
             validation_stringency=self.validation_stringency,
+            column_classes=self._column_classes,
         )
 
 
+class PickleSorterCodec(SorterCodec):
+    """Codec that pickles objects, so that decoding them does not re-parse or
+    re-validate them.  Pickled MafRecords are much larger than their lines, so
+    this trades space in memory and in the temporary files for speed when
+    decoding."""
+
+    def encode(self, obj: Any) -> bytes:
+        """Pickles the object"""
+        return pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data: bytes, start: int, length: int) -> Any:
+        """Un-pickles the object"""
+        return pickle.loads(memoryview(data)[start : start + length])
+
+
 class Sorter:
     """A class for sorting objects.  Records should be added to the sorter
     with the += or add methods.  When all records have been added, the sorter
@@ -215,35 +363,88 @@ class Sorter:
     1. An implementation of a SorterCodec than can serialize/encode and
      deserialize/decode objects.
     2. A function that creates an object with total ordering for each object
-     being sorted.  The total ordering defines the sort order.
+     being sorted.  The total ordering defines the sort order.  The keys are
+     pickled when objects are spilled to disk, so must be picklable, and must
+     pickle their own type (e.g. with ``__reduce__``) to keep it: a key that
+     is a sub-class of tuple is otherwise returned as a plain tuple.
     """
 
+    DefaultMaxBytesInRam = 256 << 20
+
+    @classmethod
+    def default_max_bytes_in_ram(cls) -> int:
+        """The default maximum # of bytes in ram: a quarter of the memory
+        currently available, but no less than ``DefaultMaxBytesInRam``."""
+        available = _available_memory()
+        if available is None:
+            return cls.DefaultMaxBytesInRam
+        return max(cls.DefaultMaxBytesInRam, available // 4)
+
     def __init__(
         self,
         max_objects_in_ram: int,
         codec: SorterCodec,
         key_func: TSortKey,
         tmp_dir: Optional[str] = None,
-        always_spill: bool = True,
+        always_spill: bool = False,
+        max_bytes_in_ram: Optional[int] = None,
+        compression: Optional[SpillCompression] = None,
+        spill_block_bytes: int = _SPILL_BUFFER_SIZE,
     ):
         """
-        Initializes a sorter object.
+        Initializes a sorter object.  Objects are spilled to disk when either
+        the number of objects or the number of bytes in ram reaches its
+        maximum.
         :param max_objects_in_ram:  the maximum # of objects in ram
         :param codec: the codec to encode and decode the object
         :param key_func: a function that creates a key used to determine the
         order of each object
         :param tmp_dir: the optional temporary directory
         :param always_spill: always spill to disk before sorting and
-        returning records
+        returning records.  Otherwise, when no objects have been spilled, they
+        are sorted and returned without compressing and merging them.
+        :param max_bytes_in_ram: the maximum # of bytes in ram of the keys of
+        the objects and of their locations in the scratch file, defaults to
+        ``default_max_bytes_in_ram()``.  The serialized objects are written to
+        the scratch file as they are added, so are not counted.
+        :param compression: the compression for temporary files, defaults to
+        ``SpillCompression.default()`` for the temporary directory.  Writing
+        uncompressed files is fastest on solid state drives, while compressing
+        them saves disk space and I/O on slower or remote disks.
+        :param spill_block_bytes: the # of bytes of sorted entries serialized
+        before they are handed off to be compressed and written to disk
         """
+        if compression is None:
+            compression = SpillCompression.default(tmp_dir)
+        elif compression == SpillCompression.Zstd and zstandard is None:
+            raise ValueError("The zstandard package is required for Zstd")
         self._max_objects_in_ram: int = max_objects_in_ram
+        self._max_bytes_in_ram: int = (
+            Sorter.default_max_bytes_in_ram()
+            if max_bytes_in_ram is None
+            else max_bytes_in_ram
+        )
         self._codec: SorterCodec = codec
         self._key_func = key_func
         self._tmp_dir: Optional[str] = tmp_dir
-        self._stash: list = [None] * max_objects_in_ram
-        self._paths: list = []
-        self._fds: list = []
-        self._objects_in_memory: int = 0
+        self._compression: SpillCompression = compression
+        self._spill_block_bytes: int = spill_block_bytes
+        # NB: the serialized objects are written to a scratch file as they are
+        # added, and only their keys and (offset, length) locations in the
+        # scratch file are kept in memory, in parallel lists.
+        self._keys: list = []
+        self._locations: list = []
+        self._scratch: Optional[IO[bytes]] = None
+        self._scratch_size: int = 0
+        # NB: the tmp files have no name on disk, so are removed when closed,
+        # even if the process is killed.
+        self._spills: List[IO[bytes]] = []
+        # NB: the temporary files are compressed and written on a background
+        # thread, in the order the writes were submitted.
+        self._spill_pool: Optional[ThreadPoolExecutor] = None
+        self._spill_writes: Deque[Future] = deque()
+        self._readers: List[Generator[Tuple[Any, List[bytes]], None, None]] = []
+        self._bytes_in_memory: int = 0
         self._always_spill: bool = always_spill
 
     def __iadd__(self, obj: Any) -> 'Sorter':
@@ -254,67 +455,223 @@ class Sorter:
         """Add an object to be sorted"""
         key = self._key_func(obj)
         data = self._codec.encode(obj)
-        self._stash[self._objects_in_memory] = _SortEntry(key=key, data=data)
-        self._objects_in_memory += 1
-        if self._objects_in_memory == self._max_objects_in_ram:
+        if self._scratch is None:
+            self._scratch = tempfile.TemporaryFile(dir=self._tmp_dir)
+        self._scratch.write(data)
+        self._keys.append(key)
+        self._locations.append((self._scratch_size, len(data)))
+        self._scratch_size += len(data)
+        self._bytes_in_memory += _key_size(key) + _LOCATION_SIZE
+        if (
+            len(self._keys) >= self._max_objects_in_ram
+            or self._bytes_in_memory >= self._max_bytes_in_ram
+        ):
             self.__spill()
         return self
 
-    def __iter__(self) -> Generator[Optional[Union[Locatable, MafRecord]], None, None]:
+    def __iter__(
+        self,
+    ) -> Generator[Optional[Union[Locatable, MafRecord, str]], None, None]:
         """:return an iterator over the sorted records"""
-        if self._paths or self._always_spill:
+        if self._spills or self._always_spill:
             self.__spill()
-            m_iter = _MergingIterator(
-                paths=self._paths, codec=self._codec, key_func=self._key_func
-            )
-            for record in m_iter:
-                yield record
+            # NB: only as many temporary files are merged as are needed to
+            # bring their number down to the maximum fan-in
+            while len(self._spills) > _MAX_MERGE_FAN_IN:
+                self.__merge_spills(
+                    min(_MAX_MERGE_FAN_IN, len(self._spills) - _MAX_MERGE_FAN_IN + 1)
+                )
+            self.__wait_for_spill_writes()
+            self._readers = [
+                _read_sorted(spill, self._compression) for spill in self._spills
+            ]
+            try:
+                # NB: merge on the keys stored in the tmp files, and only
+                # decode an object when it is returned.  A loser tree makes
+                # fewer comparisons than the heap in heapq.merge, but in
+                # Python it is slower than the heap's comparisons made in C.
+                entries = heapq.merge(*self._readers, key=itemgetter(0))
+                for data in chain.from_iterable(map(itemgetter(1), entries)):
+                    yield self._codec.decode(data, 0, len(data))
+            finally:
+                self.__close_readers()
         else:
             self.__sort_stash()
-
-            def decode(idx: int) -> MafRecord:
-                """Decodes an entry"""
-                entry = self._stash[idx]
-                data = entry.data
-                return self._codec.decode(data, 0, len(data))
-
-            for i in range(self._objects_in_memory):
-                yield decode(i)
+            for data in self.__read_stash():
+                yield self._codec.decode(data, 0, len(data))
 
     def __sort_stash(self) -> None:
         """Sorts the current objects in memory"""
-        self._stash[: self._objects_in_memory] = sorted(
-            self._stash[: self._objects_in_memory]
-        )
+        if len(self._keys) < 2:
+            return
+        keys = self._keys
+        # NB: the keys are tuples, so they are compared in C.  Purely numeric
+        # coordinate keys are packed into single integers, which are faster to
+        # compare still.  The permutation is then applied to both lists with a
+        # single itemgetter.  Sorting is a small part of the cost of a spill,
+        # so it is not handed off to another process: the keys would need to
+        # be pickled to get there, which costs about as much as the sort.
+        packed = _packed_coordinate_keys(keys)
+        if packed is not None:
+            keys = packed
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        permute = itemgetter(*order)
+        self._keys = list(permute(self._keys))
+        self._locations = list(permute(self._locations))
+
+    def __read_stash(self) -> Generator[bytes, None, None]:
+        """Reads the serialized objects currently in memory from the scratch
+        file, in the current order of the stash"""
+        if not self._locations:
+            return
+        scratch: IO[bytes] = self._scratch  # type: ignore
+        try:
+            for offset, length in self._locations:
+                scratch.seek(offset)
+                yield scratch.read(length)
+        finally:
+            # so that new objects are appended to the scratch file
+            scratch.seek(self._scratch_size)
 
     def __spill(self) -> None:
         """Spills all the objects to disk"""
-        if self._objects_in_memory > 0:
-            desc, path = tempfile.mkstemp(".gz", dir=self._tmp_dir)
-            # TODO: delete on exit!
-
-            handle = gzip.open(path, "wb")
+        if self._keys:
             self.__sort_stash()
-            for i in range(self._objects_in_memory):
-                entry = self._stash[i]
-                data = entry.data
-                handle.write(struct.pack('i', len(data)))
-                handle.write(memoryview(data))
-                self._stash[i] = None
-            handle.close()
-            self._paths.append(path)
-            self._fds.append(desc)
-            self._objects_in_memory = 0
+            self._spills.append(self.__write_spill(self.__group_stash()))
+            self._keys = []
+            self._locations = []
+            self._bytes_in_memory = 0
+
+            # reuse the scratch file for the next objects
+            scratch: IO[bytes] = self._scratch  # type: ignore
+            scratch.seek(0)
+            scratch.truncate()
+            self._scratch_size = 0
+
+    def __group_stash(self) -> Generator[Tuple[Any, List[bytes]], None, None]:
+        """Groups the serialized objects currently in memory that have equal
+        keys, which are adjacent once the stash is sorted"""
+        group_key = None
+        group: List[bytes] = []
+        for data, key in zip(self.__read_stash(), self._keys):
+            if group and key == group_key:
+                group.append(data)
+            else:
+                if group:
+                    yield group_key, group
+                group_key = key
+                group = [data]
+        if group:
+            yield group_key, group
+
+    def __merge_spills(self, num_spills: int) -> None:
+        """Merges the oldest temporary files into a single new temporary
+        file, which takes their place before the remaining ones, so that
+        objects with equal keys stay in the order they were added.
+
+        :param num_spills: the number of temporary files to merge
+        """
+        self.__wait_for_spill_writes()
+        spills = self._spills[:num_spills]
+        self._spills = self._spills[num_spills:]
+        self._readers = [_read_sorted(spill, self._compression) for spill in spills]
+        try:
+            entries = heapq.merge(*self._readers, key=itemgetter(0))
+            self._spills.insert(0, self.__write_spill(entries))
+            self.__wait_for_spill_writes()
+        finally:
+            self.__close_readers()
+            for spill in spills:
+                spill.close()
+
+    def __write_spill(self, entries: Iterable[Tuple[Any, List[bytes]]]) -> IO[bytes]:
+        """Writes the given sorted keys and serialized objects to a new
+        temporary file.  The writes are submitted to the background thread,
+        so may still be pending when the file is returned.
+
+        :param entries: the key and serialized objects with that key for each
+        entry
+        :return: the temporary file
+        """
+        spill: IO[bytes] = tempfile.TemporaryFile(
+            suffix=self._compression.value,
+            dir=self._tmp_dir,
+            buffering=_SPILL_BUFFER_SIZE,
+        )
+
+        # Each entry is stored as a header with the length of its pickled
+        # key, the number of objects and their total length, followed by the
+        # key, the length of each object if there is more than one, and the
+        # objects.  Storing objects
+        # with equal keys in one entry means their key is pickled and merged
+        # once.  The entries are serialized into a buffer that is handed off
+        # to be written once it is large enough, so that serialization
+        # overlaps with compression.
+        handle = _open_spill_for_writing(spill, self._compression)
+        buffer = bytearray()
+        dumps = pickle.dumps
+        pack = _HEADER.pack
+        for key, datas in entries:
+            # NB: keys are only compared after being read back, so tuple
+            # sub-classes are pickled as plain tuples, which is much faster
+            if isinstance(key, tuple):
+                key = tuple(key)
+            key = dumps(key, pickle.HIGHEST_PROTOCOL)
+            if len(datas) == 1:
+                data = datas[0]
+                buffer += pack(len(key), 1, len(data))
+                buffer += key
+                buffer += data
+            else:
+                lengths = [len(data) for data in datas]
+                buffer += pack(len(key), len(datas), sum(lengths))
+                buffer += key
+                buffer += struct.pack("<%di" % len(lengths), *lengths)
+                buffer += b"".join(datas)
+            if len(buffer) >= self._spill_block_bytes:
+                self.__submit_spill_write(handle.write, buffer)
+                buffer = bytearray()
+        self.__submit_spill_write(handle.write, buffer)
+        self.__submit_spill_write(handle.close)
+        self.__submit_spill_write(spill.flush)
+        return spill
+
+    def __submit_spill_write(self, func: Callable[..., Any], *args: Any) -> None:
+        """Submits a write to the temporary files to the background thread,
+        first waiting for the oldest write if too many are pending"""
+        if self._spill_pool is None:
+            self._spill_pool = ThreadPoolExecutor(max_workers=1)
+        while len(self._spill_writes) >= _MAX_PENDING_SPILL_WRITES:
+            self._spill_writes.popleft().result()
+        self._spill_writes.append(self._spill_pool.submit(func, *args))
+
+    def __wait_for_spill_writes(self) -> None:
+        """Waits for all pending writes to the temporary files, raising the
+        first error, if any"""
+        while self._spill_writes:
+            self._spill_writes.popleft().result()
+
+    def __close_readers(self) -> None:
+        """Closes the readers of any temporary files"""
+        for reader in self._readers:
+            reader.close()
+        self._readers = []
 
     def close(self) -> None:
         """Closes all temporary files."""
-        for path, desc in zip(self._paths, self._fds):
-            try:
-                os.close(desc)
-                os.remove(path)
-            except OSError as exception:
-                if exception.errno != errno.ENOENT:
-                    raise exception
+        self.__close_readers()
+        try:
+            self.__wait_for_spill_writes()
+        finally:
+            if self._spill_pool is not None:
+                self._spill_pool.shutdown()
+                self._spill_pool = None
+            if self._scratch is not None:
+                self._scratch.close()
+                self._scratch = None
+            for spill in self._spills:
+                spill.close()
+            self._spills = []
 
 
 class MafSorter(Sorter):
@@ -324,8 +681,11 @@ class MafSorter(Sorter):
         self,
         sort_order_name: str,
         scheme: Optional['MafScheme'] = None,
-        max_objects_in_ram: int = 10000,
+        max_objects_in_ram: int = 1000000,
         *args: Any,
+        max_bytes_in_ram: Optional[int] = None,
+        pass_through: bool = False,
+        compression: Optional[SpillCompression] = None,
         **kwargs: Any,
     ):
         """
@@ -333,6 +693,13 @@ class MafSorter(Sorter):
         :param sort_order_name: the canonical name of the sort order
         :param scheme: the scheme to use for the codec
         :param max_objects_in_ram: the maximum number of MafRecords in RAM.
+        :param max_bytes_in_ram: the maximum number of bytes in RAM of the keys
+        of the MafRecords and of their locations in the scratch file.  The
+        serialized MafRecords are written to the scratch file, so are not
+        counted.
+        :param pass_through: return the line for each MafRecord in sorted
+        order, rather than re-parsing it into a MafRecord.
+        :param compression: the compression for temporary files.
         :param so_args: arguments to the sort order constructor
         :param so_kwargs: keyword arguments to the sort order constructor
         """
@@ -342,6 +709,8 @@ class MafSorter(Sorter):
 
         super(MafSorter, self).__init__(
             max_objects_in_ram=max_objects_in_ram,
-            codec=MafSorterCodec(scheme=scheme),
+            codec=MafSorterCodec(scheme=scheme, pass_through=pass_through),
             key_func=sort_order.sort_key(),
+            max_bytes_in_ram=max_bytes_in_ram,
+            compression=compression,
         )
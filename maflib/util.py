@@ -1,8 +1,9 @@
 """A set of useful utility classes and methods"""
 import sys
 from contextlib import contextmanager
+from functools import lru_cache
 from io import StringIO
-from typing import Any, Generator, Iterator, TextIO, Tuple, Type
+from typing import Any, Generator, Iterator, Optional, TextIO, Tuple, Type
 
 from maflib.logger import Logger
 
@@ -12,22 +13,31 @@ class LineReader:
     A little class that can read the next line without consuming it.
     """
 
+    __slots__ = ("_file", "_readline", "_line", "_line_number")
+
     def __init__(self, fh: StringIO):
         self._file = fh
-        self._line = self.__read_line()
+        # NB: calling the bound readline is faster than next() with a default
+        # on an iterator over the file, for both files and StringIO.
+        self._readline = fh.readline
+        # NB: the first line is read when it is first needed, not here
+        self._line: Optional[str] = None
         self._line_number: int = 0
 
     def read_line(self) -> str:
         """Reads a single line"""
-        cur_line = self._line
-        if self._line:
+        cur_line = self.peek_line()
+        if cur_line:
             self._line = self.__read_line()
             self._line_number += 1
         return cur_line
 
     def __read_line(self) -> str:
         """Reads a line from the underlying file"""
-        return self._file.readline().rstrip("\r\n")
+        # NB: a single rstrip is faster than checking for and slicing off the
+        # line ending in Python, or than two calls to removesuffix, which is
+        # also not available on Python 3.8.
+        return self._readline().rstrip("\r\n")
 
     def line_number(self) -> int:
         """
@@ -37,6 +47,8 @@ class LineReader:
 
     def peek_line(self) -> str:
         """Gets the next line without consuming it"""
+        if self._line is None:
+            self._line = self.__read_line()
         return self._line
 
     def __iter__(self) -> 'LineReader':
@@ -51,7 +63,10 @@ class LineReader:
         line = self.peek_line()
         if not line:
             raise StopIteration
-        return self.read_line()
+        # NB: the body of read_line is inlined, as this is called per line
+        self._line = self.__read_line()
+        self._line_number += 1
+        return line
 
     def close(self) -> None:
         """Close the reader and the underling file handle"""
@@ -60,12 +75,19 @@ class LineReader:
 
 TPeekReturn = Any
 
+# Marks that a PeekableIterator has no more elements, since None may be one
+_EXHAUSTED = object()
+
 
 class PeekableIterator:
     """An iterator that has a `peek()` method."""
 
+    __slots__ = ("_iter", "_next", "_peek")
+
     def __init__(self, _iter: Iterator[TPeekReturn]):
         self._iter = _iter
+        self._next = iter(_iter).__next__
+        self._peek: TPeekReturn
         self.__update_peek()
 
     def __iter__(self) -> 'PeekableIterator':
@@ -76,42 +98,71 @@ class PeekableIterator:
         return self.__next__()
 
     def __next__(self) -> TPeekReturn:
-        if self._peek is None:
-            raise StopIteration
         to_return = self._peek
-        self.__update_peek()
+        if to_return is _EXHAUSTED:
+            raise StopIteration
+        # NB: the body of __update_peek is inlined, as this is called per
+        # element
+        try:
+            self._peek = self._next()
+        except StopIteration:
+            self._peek = _EXHAUSTED
         return to_return
 
     def __update_peek(self) -> None:
-        self._peek = next(self._iter, None)
+        try:
+            self._peek = self._next()
+        except StopIteration:
+            self._peek = _EXHAUSTED
 
     def peek(self) -> TPeekReturn:
         """Returns the next element without consuming it, or None
         if there are no more elements."""
-        return self._peek
+        peek = self._peek
+        return None if peek is _EXHAUSTED else peek
+
+
+class _NullIO(StringIO):
+    """A text stream that discards everything written to it"""
+
+    def write(self, s: str) -> int:
+        return len(s)
 
 
 @contextmanager
-def captured_output() -> Generator[Tuple[TextIO, TextIO], None, None]:
-    """Captures stderr and stdout and returns them"""
-    new_out, new_err = StringIO(), StringIO()
+def captured_output(
+    discard: bool = False,
+) -> Generator[Tuple[TextIO, TextIO], None, None]:
+    """Captures stderr and stdout and returns them.
+
+    :param discard: discard the output rather than keeping it, when it will
+    not be inspected
+    """
+    new_out: StringIO
+    new_err: StringIO
+    if discard:
+        new_out, new_err = _NullIO(), _NullIO()
+    else:
+        new_out, new_err = StringIO(), StringIO()
     old_out, old_err = sys.stdout, sys.stderr
     try:
         sys.stdout, sys.stderr = new_out, new_err
+        # NB: the root logger's handler holds the stderr it was set up with, so
+        # it is set up again to write to the new stderr.
         Logger.setup_root_logger()
         yield sys.stdout, sys.stderr
     finally:
         sys.stdout, sys.stderr = old_out, old_err
 
 
+@lru_cache(maxsize=None)
 def extend_class(base_cls: Any, cls: Any) -> Type:
-    """Apply mixins"""
+    """Apply mixins.  The same class is returned each time the same mixin is
+    applied to the same base class."""
     base_cls_name = base_cls.__name__
     return type(base_cls_name, (cls, base_cls), {})
 
 
 def extend_instance(obj: object, cls: type) -> None:
     """Apply mixins after object creation"""
-    base_cls = obj.__class__
-    base_cls_name = obj.__class__.__name__
-    obj.__class__ = type(base_cls_name, (cls, base_cls), {})
+    obj.__class__ = extend_class(obj.__class__, cls)  # type: ignore
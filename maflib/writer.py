@@ -5,17 +5,30 @@
 
 
 import gzip
+import io
 import logging
-from typing import IO, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import IO, Deque, Iterator, Optional
 
 from maflib.header import MafHeader
 from maflib.logger import Logger
 from maflib.record import MafRecord
-from maflib.schemes import NoRestrictionsScheme
+from maflib.schemes import MafScheme, NoRestrictionsScheme
 from maflib.sort_order import SortOrderChecker
 from maflib.sorter import MafSorter
 from maflib.validation import ValidationStringency
 
+# NB: records are written one line at a time, so use a large buffer to coalesce
+# them into fewer writes (and fewer, larger chunks handed to zlib).
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# The number of sorted lines written at once on the background thread, and the
+# maximum number of such batches waiting to be written.
+_SORTED_WRITE_BATCH_SIZE = 4096
+_MAX_PENDING_SORTED_WRITES = 4
+
 
 class MafWriter(object):
     """A writer of a MAF file"""
@@ -39,6 +52,11 @@ class MafWriter(object):
             if (validation_stringency is None)
             else validation_stringency
         )
+        # NB: records' validation errors are discarded when silent, so do not
+        # spend time collecting them.
+        self._validate_records = (
+            self.validation_stringency != ValidationStringency.Silent
+        )
 
         # validate the header
         self._header.validate(
@@ -47,15 +65,22 @@ class MafWriter(object):
 
         # write the header
         if len(self._header) > 0:
-            self._handle.write(str(self._header) + "\n")
+            self._handle.write(str(self._header))
+            self._handle.write("\n")
 
         # write the column names if we have a scheme
         self._scheme = self._header.scheme()
-        if self._scheme:
-            self._handle.write(
-                MafRecord.ColumnSeparator.join(self._scheme.column_names()) + "\n"
-            )
-            self._set_checker_and_sorter()
+        if self._scheme is not None:
+            self._set_scheme(self._scheme)
+
+    def _set_scheme(self, scheme: MafScheme) -> None:
+        """Sets the scheme, writes the column names, and sets the sort order
+        checker and sorter."""
+        self._scheme = scheme
+        self._handle.write(
+            MafRecord.ColumnSeparator.join(self._scheme.column_names()) + "\n"
+        )
+        self._set_checker_and_sorter()
 
     def _set_checker_and_sorter(self) -> None:
         """Set the sort order checker and sorter.  Must be called **after**
@@ -65,8 +90,12 @@ class MafWriter(object):
             self._sorter = None
         else:
             self._checker = None
+            # NB: the sorted records are only written, so pass through the
+            # lines rather than re-parsing them.
             self._sorter = MafSorter(
-                sort_order_name=self._header.sort_order().name(), scheme=self._scheme  # type: ignore
+                sort_order_name=self._header.sort_order().name(),  # type: ignore
+                scheme=self._scheme,
+                pass_through=True,
             )
 
     def header(self) -> MafHeader:
@@ -76,28 +105,29 @@ class MafWriter(object):
     def __iadd__(self, record: MafRecord) -> 'MafWriter':
         """Write a MafRecord."""
 
-        # set the scheme and write the column names if not already written
-        if not self._scheme:
+        # set the scheme and write the column names if not already written.
+        # NB: compare to None, as the truth value of a scheme is its length.
+        if self._scheme is None:
             column_names = [str(key) for key in record.keys()]
-            self._scheme = NoRestrictionsScheme(column_names=column_names)
-            self._handle.write(
-                MafRecord.ColumnSeparator.join(self._scheme.column_names()) + "\n"
-            )
-            self._set_checker_and_sorter()
+            self._set_scheme(NoRestrictionsScheme(column_names=column_names))
 
         # validate the record
-        record.validate(
-            validation_stringency=self.validation_stringency,
-            logger=self._logger,
-            reset_errors=True,
-            scheme=self._scheme,
-        )
+        if self._validate_records:
+            record.validate(
+                validation_stringency=self.validation_stringency,
+                logger=self._logger,
+                reset_errors=True,
+                scheme=self._scheme,
+            )
 
         # either write it directly, or add it to the sorter
         if self._sorter:
             self._sorter += record  # type: ignore
         else:
-            self._handle.write(str(record) + "\n")
+            # NB: two writes into the buffered handle avoid copying the
+            # (wide) line just to append a newline.
+            self._handle.write(str(record))
+            self._handle.write("\n")
 
         return self
 
@@ -109,8 +139,23 @@ class MafWriter(object):
         """Closes the underlying file handle, and writes the records if the
         output was to be sorted."""
         if self._sorter:
-            for rec in self._sorter:
-                self._handle.write(str(rec) + "\n")
+            # NB: the sorted lines are joined into batches that are written on
+            # a background thread, so that writing (and compressing) the
+            # output overlaps with merging the sorted records.  The sorter
+            # passes through the lines, so yields strings.
+            lines: Iterator[str] = iter(self._sorter)  # type: ignore
+            write = self._handle.write
+            writes: Deque[Future] = deque()
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                batch = list(islice(lines, _SORTED_WRITE_BATCH_SIZE))
+                while batch:
+                    batch.append("")  # for the trailing newline
+                    while len(writes) >= _MAX_PENDING_SORTED_WRITES:
+                        writes.popleft().result()
+                    writes.append(pool.submit(write, "\n".join(batch)))
+                    batch = list(islice(lines, _SORTED_WRITE_BATCH_SIZE))
+                while writes:
+                    writes.popleft().result()
             self._sorter.close()
         self._handle.close()
 
@@ -122,7 +167,8 @@ class MafWriter(object):
         validation_stringency: ValidationStringency = ValidationStringency.Strict,
         assume_sorted: bool = True,
     ) -> 'MafWriter':
-        """Create a MafWriter from the given file handle."""
+        """Create a MafWriter from the given file handle.  The handle is written
+        to once per record, so it should be buffered."""
         return MafWriter(
             handle=desc,
             header=header,
@@ -137,12 +183,21 @@ class MafWriter(object):
         header: MafHeader,
         validation_stringency: ValidationStringency = ValidationStringency.Strict,
         assume_sorted: bool = True,
+        compresslevel: int = 9,
     ) -> 'MafWriter':
-        """Create a MafWriter from the given path ."""
+        """Create a MafWriter from the given path .  If the path ends with
+        ``.gz``, the output is compressed at the given ``compresslevel``, where
+        lower levels are faster but compress less."""
         if path.endswith(".gz"):
-            handle = gzip.open(path, "wt")
+            # NB: compression is done in-process.  Callers wanting parallel
+            # compression (e.g. piping to ``pigz``) should use ``from_fd`` with
+            # the pipe to the compressor.
+            raw = gzip.open(path, "wb", compresslevel=compresslevel)
+            handle: IO = io.TextIOWrapper(
+                io.BufferedWriter(raw, buffer_size=_WRITE_BUFFER_SIZE)  # type: ignore
+            )
         else:
-            handle = open(path, "w")
+            handle = open(path, "w", buffering=_WRITE_BUFFER_SIZE)
         return MafWriter.from_fd(
             desc=handle,
             header=header,
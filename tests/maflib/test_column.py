@@ -5,7 +5,7 @@ from collections import OrderedDict
 
 from maflib.column import MafColumnRecord, MafCustomColumnRecord
 from maflib.column_types import FloatColumn, StringColumn
-from maflib.schemes import MafScheme
+from maflib.schemes import MafScheme, NoRestrictionsScheme
 from maflib.validation import MafValidationErrorType
 
 
@@ -123,6 +123,18 @@ class TestMafColumnRecord(unittest.TestCase):
                 scheme=scheme,
             )
 
+    def test_build_with_scheme_large_column_index(self):
+        names = ["column%d" % i for i in range(300)]
+        scheme = NoRestrictionsScheme(column_names=names)
+
+        # the column index is equal to, but not the same object as, the index
+        # in the scheme
+        column_index = int("299")
+        column = MafColumnRecord.build(
+            name="column299", value="value", column_index=column_index, scheme=scheme
+        )
+        self.assertEqual(column.column_index, 299)
+
 
 class TestMafCustomColumnRecord(unittest.TestCase):
     class ValidColumn(MafCustomColumnRecord):
@@ -213,5 +225,23 @@ class TestMafCustomColumnRecord(unittest.TestCase):
         with self.assertRaises(ValueError):
             TestMafCustomColumnRecord.ValidColumn.build_nullable(name="Name")
 
+    def test_build_nullable_values_are_not_shared(self):
+        class EmptyListColumn(MafCustomColumnRecord):
+            @classmethod
+            def __nullable_dict__(cls):
+                return {"": []}
+
+            @classmethod
+            def __build__(cls, value):
+                return value.split(",")
+
+        first = EmptyListColumn.build("key", "")
+        second = EmptyListColumn.build("key", "")
+        self.assertTrue(first.is_null())
+        first.value.append("value")
+        self.assertListEqual(second.value, [])
+        self.assertTrue(second.is_null())
+        self.assertEqual(str(second), "")
+
 
 # __END__
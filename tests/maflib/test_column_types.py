@@ -280,6 +280,23 @@ class TestEnumColumn(TestCase):
             "was not of type 'TestEnum'",
         )
 
+    def test_valid_member(self):
+        self.is_column_is_valid(
+            TestEnumColumn.NotNullableEnumColumn.build(
+                "key", TestEnumColumn.TestEnum.Bar
+            ),
+            TestEnumColumn.TestEnum.Bar,
+        )
+
+    def test_valid_values(self):
+        valid_values = TestEnumColumn.NullableEnumColumn.__valid_values__()
+        self.assertSetEqual(
+            set(valid_values), {"Foo", "1.Foo", "Bar", "2.Bar", "Null", "3.Null"}
+        )
+        self.assertIs(
+            TestEnumColumn.NotNullableEnumColumn.__valid_values__(), valid_values
+        )
+
 
 class TestSequenceOfStrings(TestCase):
     def test_valid(self):
@@ -310,9 +327,12 @@ class TestSequenceOfIntegers(TestCase):
         input_values = ["", "1", "1;2", "1;2;3"]
         expected_values = [[], [1], [1, 2], [1, 2, 3]]
         for in_value, exp_values in zip(input_values, expected_values):
-            self.is_column_is_valid(
-                column_types.SequenceOfIntegers.build("key", in_value), exp_values, [[]]
-            )
+            with self.subTest(value=in_value):
+                self.is_column_is_valid(
+                    column_types.SequenceOfIntegers.build("key", in_value),
+                    exp_values,
+                    [[]],
+                )
         self.is_column_is_valid(
             column_types.SequenceOfIntegers.build("key", ""), [], [[]]
         )
@@ -347,10 +367,11 @@ class TestSequenceOfIntegers(TestCase):
 class TestDnaString(TestCase):
     def test_valid(self):
         for dna in ["A", "ACGT", "GATTACA"]:
-            self.is_column_is_valid(
-                column_types.NullableDnaString.build("key", dna), dna, [None]
-            )
-            self.is_column_is_valid(column_types.DnaString.build("key", dna), dna)
+            with self.subTest(value=dna):
+                self.is_column_is_valid(
+                    column_types.NullableDnaString.build("key", dna), dna, [None]
+                )
+                self.is_column_is_valid(column_types.DnaString.build("key", dna), dna)
         self.is_column_is_valid(
             column_types.NullableDnaString.build("key", ""), None, [None]
         )
@@ -567,12 +588,18 @@ class TestNullableYOrN(TestCase):
 
 class TestBooleanColumn(TestCase):
     def test_valid(self):
-        self.is_column_is_valid(column_types.BooleanColumn.build("key", "TRUE"), True)
-        self.is_column_is_valid(column_types.BooleanColumn.build("key", "True"), True)
-        self.is_column_is_valid(column_types.BooleanColumn.build("key", "true"), True)
-        self.is_column_is_valid(column_types.BooleanColumn.build("key", "FALSE"), False)
-        self.is_column_is_valid(column_types.BooleanColumn.build("key", "False"), False)
-        self.is_column_is_valid(column_types.BooleanColumn.build("key", "false"), False)
+        for value, expected in [
+            ("TRUE", True),
+            ("True", True),
+            ("true", True),
+            ("FALSE", False),
+            ("False", False),
+            ("false", False),
+        ]:
+            with self.subTest(value=value):
+                self.is_column_is_valid(
+                    column_types.BooleanColumn.build("key", value), expected
+                )
 
     def test_invalid(self):
         self.is_column_invalid(
@@ -626,40 +653,45 @@ class TestCustomEnums(TestCase):
 
     def test_valid(self):
         for clazz in TestCustomEnums.classes:
-            # Test every value in the Enum class
-            enum_clazz = clazz.__enum_class__()
-            for enum_value in enum_clazz:
-                name = enum_value.name
-                value = enum_value.value
-                # Test both by name and by value
-                self.is_column_is_valid(
-                    clazz.build("key", str(name)),
-                    enum_value,
-                    clazz.__nullable_values__(),
-                )
-                self.is_column_is_valid(
-                    clazz.build("key", value), enum_value, clazz.__nullable_values__()
-                )
+            # NB: test each class separately, so that one failure does not hide
+            # the results for the remaining classes
+            with self.subTest(clazz=clazz.__name__):
+                self.__test_valid(clazz)
 
     def test_invalid(self):
         for clazz in TestCustomEnums.classes:
-            # Test every value in the Enum class
-            enum_clazz = clazz.__enum_class__()
-            names = set([enum_value.name for enum_value in enum_clazz])
-            values = set([enum_value.value for enum_value in enum_clazz])
-            valid_values = names | values
-
-            # Find an invalid value
-            value = "Foo"
-            while value in valid_values:
-                value = value + "_"
-
-            self.is_column_invalid(
-                clazz.build("key", next(iter(valid_values))), value, "was not of type"
+            with self.subTest(clazz=clazz.__name__):
+                self.__test_invalid(clazz)
+
+    def __test_valid(self, clazz):
+        # Test every value in the Enum class
+        enum_clazz = clazz.__enum_class__()
+        for enum_value in enum_clazz:
+            name = enum_value.name
+            value = enum_value.value
+            # Test both by name and by value
+            self.is_column_is_valid(
+                clazz.build("key", str(name)),
+                enum_value,
+                clazz.__nullable_values__(),
+            )
+            self.is_column_is_valid(
+                clazz.build("key", value), enum_value, clazz.__nullable_values__()
             )
 
-            with self.assertRaises(KeyError):
-                clazz.build("key", value)
+    def __test_invalid(self, clazz):
+        valid_values = clazz.__valid_values__()
+
+        # A value that is neither the name nor the value of any member
+        value = "__not_in_enum__"
+        self.assertNotIn(value, valid_values)
+
+        self.is_column_invalid(
+            clazz.build("key", next(iter(valid_values))), value, "was not of type"
+        )
+
+        with self.assertRaises(KeyError):
+            clazz.build("key", value)
 
 
 class TestPickColumn(TestCase):
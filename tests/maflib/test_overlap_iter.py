@@ -7,10 +7,9 @@ from maflib.overlap_iter import (
     AlleleOverlapType,
     LocatableByAlleleOverlapIterator,
     LocatableOverlapIterator,
-    _SortOrderEnforcingIterator,
 )
 from maflib.record import MafRecord
-from maflib.sort_order import Coordinate
+from maflib.sort_order import Coordinate, SortOrderEnforcingIterator
 
 
 class DummyRecord(MafRecord):
@@ -37,7 +36,7 @@ class TestSortOrderEnforcingIterator(unittest.TestCase):
             DummyRecord("C", 1, 2),
         ]
 
-        items = [r for r in _SortOrderEnforcingIterator(iter(records), sort_order)]
+        items = [r for r in SortOrderEnforcingIterator(iter(records), sort_order)]
 
         self.assertListEqual(items, records)
         for i, rec in enumerate(items):
@@ -49,12 +48,11 @@ class TestSortOrderEnforcingIterator(unittest.TestCase):
         records = [DummyRecord("A", 2, 2), DummyRecord("A", 1, 2)]
 
         with self.assertRaises(Exception) as context:
-            [r for r in _SortOrderEnforcingIterator(iter(records), sort_order)]
+            [r for r in SortOrderEnforcingIterator(iter(records), sort_order)]
         self.assertIn("out of order", str(context.exception))
 
 
 class TestMafOverlapIterator(unittest.TestCase):
-
     RecordsNoOverlap = [
         DummyRecord("A", 1, 10),
         DummyRecord("A", 110, 200),
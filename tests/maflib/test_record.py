@@ -356,6 +356,18 @@ class TestMafRecord(unittest.TestCase):
         self.assertListEqual(list(record.keys()), column_names)
         self.assertListEqual(record.column_values(), values)
 
+    def test_from_line_with_column_classes(self):
+        scheme = TestMafRecord.TestScheme()
+        values = ["string1", "3.14", "string3"]
+        record = MafRecord.from_line(
+            line=MafRecord.ColumnSeparator.join(values),
+            scheme=scheme,
+            validation_stringency=ValidationStringency.Silent,
+            column_classes=[StringColumn, FloatColumn, StringColumn],
+        )
+        self.assertEqual(len(record.validation_errors), 0)
+        self.assertListEqual(record.column_values(), ["string1", 3.14, "string3"])
+
     def test_from_line_with_scheme_column_out_of_order(self):
         scheme = TestMafRecord.TestScheme()
         column_names = ["str2", "float", "str1"]
@@ -14,6 +14,7 @@ from maflib.scheme_factory import (
     find_scheme_class,
     get_built_in_filenames,
     get_column_types,
+    index_schemes,
     load_all_scheme_data,
     load_all_schemes,
     scheme_to_columns,
@@ -251,6 +252,13 @@ class TestSchemeFactory(unittest.TestCase):
         )
         self.assertTrue(len(data) > 1)
 
+        # the data is returned in the same order as the filenames
+        for filename, datum in zip(filenames, data):
+            single = load_all_scheme_data(
+                [filename], column_types=TestSchemeFactory.column_types
+            )
+            self.assertEqual(single, [datum])
+
         # test malformed JSON
         fd, fn = tmp_file("blah blah")
         fd.close()
@@ -305,5 +313,18 @@ class TestSchemeFactory(unittest.TestCase):
         self.assertFalse(scheme.is_basic())
         self.assertEqual(len(scheme.__column_dict__()), 125)
 
+    def test_index_schemes(self):
+        schemes = load_all_schemes()
+        by_version_and_annotation, by_annotation, basic_by_version = index_schemes(
+            schemes
+        )
+        for scheme in schemes:
+            key = (scheme.version(), scheme.annotation_spec())
+            self.assertIs(by_version_and_annotation[key], scheme)
+            self.assertIs(by_annotation[scheme.annotation_spec()], scheme)
+            if scheme.is_basic():
+                self.assertIs(basic_by_version[scheme.version()], scheme)
+        self.assertNotIn(NoRestrictionsScheme.version(), basic_by_version)
+
 
 # __END__
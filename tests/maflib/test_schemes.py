@@ -63,6 +63,15 @@ class TestMafScheme(unittest.TestCase):
         self.assertEqual(scheme.column_index("key1"), 1)
         self.assertEqual(scheme.column_index("key2"), None)
 
+    def test_column_index_and_class(self):
+        scheme = TestMafScheme.TestScheme()
+        self.assertEqual(
+            scheme.column_index_and_class(MafHeader.VersionKey),
+            (0, MafHeaderVersionRecord),
+        )
+        self.assertEqual(scheme.column_index_and_class("key1"), (1, MafHeaderRecord))
+        self.assertIsNone(scheme.column_index_and_class("key2"))
+
     def test_column_description(self):
         scheme = TestMafScheme.TestScheme()
         self.assertEqual(
@@ -93,6 +102,13 @@ class TestNoRestrictionsScheme(unittest.TestCase):
         with self.assertRaises(ValueError):
             NoRestrictionsScheme.__column_dict__()
 
+    def test_column_description(self):
+        scheme = NoRestrictionsScheme(column_names=["key1", "key2"])
+        self.assertEqual(scheme.column_description("key1"), "")
+        self.assertEqual(scheme.column_description("key2"), "")
+        self.assertEqual(scheme.column_description("key3"), None)
+        self.assertListEqual(scheme.column_descriptions(), ["key1", "key2"])
+
 
 class TestGdcV1_0_0_Scheme(unittest.TestCase):
     class NoAnnotationSpecScheme(MafScheme):
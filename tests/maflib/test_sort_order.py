@@ -1,7 +1,10 @@
 import os
+import pickle
 import unittest
 
+from maflib.column import MafColumnRecord
 from maflib.locatable import Locatable
+from maflib.record import MafRecord
 from maflib.sort_order import (
     BarcodesAndCoordinate,
     Coordinate,
@@ -55,7 +58,6 @@ class TestSortOrderKey(unittest.TestCase):
 
 
 class TestBarcodeAndCoordinateKey(unittest.TestCase):
-
     TestSortOrder = BarcodesAndCoordinate()
 
     class DummyRecord(Locatable):
@@ -153,9 +155,49 @@ class TestBarcodeAndCoordinateKey(unittest.TestCase):
         sort_key = BarcodesAndCoordinate().sort_key()
         self.assertEqual(str(sort_key(r1)), "A\tB\tC\t1\t2")
 
+    def test_key_maf_records_with_different_columns(self):
+        def record(names_and_values):
+            rec = MafRecord()
+            for name, value in names_and_values:
+                rec.add(MafColumnRecord(name, value))
+            return rec
+
+        locus = [("Chromosome", "C"), ("Start_Position", 1), ("End_Position", 2)]
+        r1 = record(
+            [("Tumor_Sample_Barcode", "A"), ("Matched_Norm_Sample_Barcode", "B")]
+            + locus
+        )
+        r2 = record(
+            [("Matched_Norm_Sample_Barcode", "D"), ("Tumor_Sample_Barcode", "C")]
+            + locus
+        )
+        r3 = record(locus)
+        sort_key = BarcodesAndCoordinate().sort_key()
+        self.assertEqual(sort_key(r1), ("A", "B", "C", 1, 2))
+        self.assertEqual(sort_key(r2), ("C", "D", "C", 1, 2))
+        self.assertEqual(sort_key(r1), ("A", "B", "C", 1, 2))
+        key = sort_key(r3)
+        self.assertIsNone(key.tumor_barcode)
+        self.assertIsNone(key.normal_barcode)
+        self.assertEqual(key[2:], ("C", 1, 2))
+
+    def test_none_sorts_last(self):
+        r1 = TestBarcodeAndCoordinateKey.DummyRecord("A", "B", "C", 1, 2)
+        r2 = TestBarcodeAndCoordinateKey.DummyRecord("A", None, "C", 1, 2)
+        self.__test_diff(r1, r2)
+        r3 = TestBarcodeAndCoordinateKey.DummyRecord(None, "B", "C", 1, 2)
+        self.__test_diff(r2, r3)
+
+        sort_key = TestBarcodeAndCoordinateKey.TestSortOrder.sort_key()
+        key = sort_key(r2)
+        self.assertIsNone(key.normal_barcode)
+        self.assertEqual(str(key), "A\tNone\tC\t1\t2")
+        result = pickle.loads(pickle.dumps(key))
+        self.assertEqual(result, key)
+        self.assertIsNone(result.normal_barcode)
 
-class TestCoordinateKey(unittest.TestCase):
 
+class TestCoordinateKey(unittest.TestCase):
     TestSortOrder = Coordinate()
 
     class DummyRecord(Locatable):
@@ -229,11 +271,36 @@ class TestCoordinateKey(unittest.TestCase):
         fd.close()
         os.remove(fn)
 
+    def test_none_sorts_last(self):
+        r1 = TestCoordinateKey.DummyRecord("C", 1, 2)
+        r2 = TestCoordinateKey.DummyRecord("C", 1, None)
+        self.__test_diff(r1, r2)
+        r3 = TestCoordinateKey.DummyRecord("C", None, 2)
+        self.__test_diff(r2, r3)
+        self.assertIsNone(TestCoordinateKey.TestSortOrder.sort_key()(r3).start)
+
     def test_key_str(self):
         r1 = TestCoordinateKey.DummyRecord("C", 1, 2)
         sort_key = Coordinate().sort_key()
         self.assertEqual(str(sort_key(r1)), "C\t1\t2")
 
+    def test_key_is_tuple(self):
+        r1 = TestCoordinateKey.DummyRecord("C", 1, 2)
+        key = Coordinate(contigs=["B", "C"]).sort_key()(r1)
+        self.assertEqual(key, (1, 1, 2))
+        self.assertEqual((key.chromosome, key.start, key.end), (1, 1, 2))
+        extended = key.with_end(10)
+        self.assertIs(type(extended), type(key))
+        self.assertEqual(extended, (1, 1, 10))
+
+    def test_key_pickle(self):
+        r1 = TestBarcodeAndCoordinateKey.DummyRecord("A", "B", "C", 1, 2)
+        key = BarcodesAndCoordinate().sort_key()(r1)
+        result = pickle.loads(pickle.dumps(key))
+        self.assertIs(type(result), type(key))
+        self.assertEqual(result, key)
+        self.assertEqual(result.tumor_barcode, "A")
+
     def test_not_locatable(self):
         sort_key = Coordinate().sort_key()
 
@@ -1,13 +1,29 @@
 #!/usr/bin/env python3
 import os
+import tempfile
 import unittest
 from collections import OrderedDict
+from unittest import mock
 
-from maflib.column_types import IntegerColumn, StringColumn
+from maflib import sorter as sorter_module
+from maflib.column_types import IntegerColumn, NullableStringColumn, StringColumn
 from maflib.locatable import Locatable
+from maflib.record import MafRecord
 from maflib.schemes import MafScheme
-from maflib.sort_order import BarcodesAndCoordinate
-from maflib.sorter import MafSorter, MafSorterCodec, Sorter
+from maflib.sort_order import BarcodesAndCoordinate, Coordinate
+from maflib.sorter import (
+    MafSorter,
+    MafSorterCodec,
+    PickleSorterCodec,
+    Sorter,
+    SpillCompression,
+    _available_memory,
+    _is_on_solid_state_drive,
+    _open_spill_for_reading,
+    _open_spill_for_writing,
+    _packed_coordinate_keys,
+    _read_sorted,
+)
 from tests.maflib.testutils import tmp_file
 
 
@@ -74,6 +90,38 @@ class TestMafSorterCodec(unittest.TestCase):
         bytes = codec.encode(original)
         result = codec.decode(bytes, 0, len(bytes))
         self.assertEqual(str(result), str(original))
+        self.assertListEqual(
+            codec._column_classes, list(DummyScheme.__column_dict__().values())
+        )
+
+    def test_pass_through(self):
+        codec = MafSorterCodec(scheme=DummyScheme(), pass_through=True)
+        original = DummyRecord("A", "B", "C", 1, 2)
+        bytes = codec.encode(original)
+        result = codec.decode(bytes, 0, len(bytes))
+        self.assertEqual(result, str(original))
+        record = codec.from_line(result)
+        self.assertEqual(record.value("End_Position"), 2)
+
+
+class TestPickleSorterCodec(unittest.TestCase):
+    def test_round_trip(self):
+        codec = PickleSorterCodec()
+        original = DummyRecord("A", "B", "C", 1, 2)
+        bytes = codec.encode(original)
+        result = codec.decode(b"xx" + bytes, 2, len(bytes))
+        self.assertIs(type(result), DummyRecord)
+        self.assertEqual(str(result), str(original))
+
+    def test_sorter(self):
+        sorter = Sorter(10, PickleSorterCodec(), BarcodesAndCoordinate().sort_key())
+        for i in range(25):
+            sorter += DummyRecord("A", "B", "C", 1, 24 - i)
+        records = [r for r in sorter]
+        sorter.close()
+        self.assertListEqual(
+            [r.value("End_Position") for r in records], list(range(25))
+        )
 
 
 class TestSorter(unittest.TestCase):
@@ -108,14 +156,278 @@ class TestSorter(unittest.TestCase):
             record = records[i]
             self.assertEqual(record.value("End_Position"), i)
 
+    def test_no_spilling_by_default(self):
+        sorter = Sorter(100, self.codec(), BarcodesAndCoordinate().sort_key())
+        for i in range(10):
+            sorter += DummyRecord("A", "B", "C", 1, 10 - i - 1)
+        records = [r for r in sorter]
+        self.assertListEqual(sorter._spills, [])
+        sorter.close()
+        self.assertListEqual(
+            [r.value("End_Position") for r in records], list(range(10))
+        )
+
     def test_spilling_to_disk(self):
+        self.__test_spilling_to_disk()
+
+    def test_spilling_to_disk_with_gzip(self):
+        with mock.patch("maflib.sorter.zstandard", None):
+            self.__test_spilling_to_disk()
+
+    def test_spilling_to_disk_with_compression(self):
+        for compression in SpillCompression:
+            if compression == SpillCompression.Zstd and sorter_module.zstandard is None:
+                continue
+            with self.subTest(compression=compression):
+                self.__test_spilling_to_disk(compression=compression)
+
+    def test_default_compression(self):
+        with mock.patch("maflib.sorter._is_on_solid_state_drive", return_value=True):
+            self.assertEqual(SpillCompression.default(), SpillCompression.Uncompressed)
+        # NB: zstandard is an optional dependency, so pretend it is installed
+        with mock.patch("maflib.sorter.zstandard", mock.Mock()), mock.patch(
+            "maflib.sorter._is_on_solid_state_drive", return_value=False
+        ):
+            self.assertEqual(SpillCompression.default(), SpillCompression.Zstd)
+        self.assertFalse(_is_on_solid_state_drive("/no/such/path"))
+
+    def test_zstd_not_installed(self):
+        with mock.patch("maflib.sorter.zstandard", None), mock.patch(
+            "maflib.sorter._is_on_solid_state_drive", return_value=False
+        ):
+            self.assertEqual(SpillCompression.default(), SpillCompression.Gzip)
+            with self.assertRaises(ValueError):
+                Sorter(
+                    100,
+                    self.codec(),
+                    BarcodesAndCoordinate().sort_key(),
+                    compression=SpillCompression.Zstd,
+                )
+
+    def test_spilling_to_disk_by_bytes(self):
+        num_records = 100
+        sorter = Sorter(
+            num_records * 10,
+            self.codec(),
+            BarcodesAndCoordinate().sort_key(),
+            always_spill=False,
+            max_bytes_in_ram=1024,
+        )
+        for i in range(num_records):
+            sorter += DummyRecord("A", "B", "C", 1, num_records - i - 1)
+        self.assertTrue(len(sorter._spills) > 1)
+        records = [r for r in sorter]
+        sorter.close()
+        self.assertListEqual(
+            [r.value("End_Position") for r in records], list(range(num_records))
+        )
+
+    def test_serialized_objects_not_counted_in_ram(self):
+        num_records = 10
+        sorter = Sorter(
+            num_records * 10,
+            self.codec(),
+            Coordinate().sort_key(),
+            max_bytes_in_ram=1024 * num_records,
+        )
+        # NB: the barcodes are only in the serialized objects, not in the keys
+        for i in range(num_records):
+            sorter += DummyRecord("A" * 4096, "B" * 4096, "C", 1, num_records - i)
+        self.assertListEqual(sorter._spills, [])
+        records = [r for r in sorter]
+        sorter.close()
+        self.assertListEqual(
+            [r.value("End_Position") for r in records], list(range(1, num_records + 1))
+        )
+
+    def test_available_memory(self):
+        meminfo = "MemTotal: 4096 kB\nMemFree: 1024 kB\nMemAvailable: 2048 kB\n"
+        with mock.patch("builtins.open", mock.mock_open(read_data=meminfo)):
+            self.assertEqual(_available_memory(), 2048 * 1024)
+        with mock.patch("builtins.open", side_effect=OSError), mock.patch(
+            "os.sysconf", side_effect=ValueError
+        ):
+            self.assertIsNone(_available_memory())
+
+    def test_default_max_bytes_in_ram(self):
+        with mock.patch("maflib.sorter._available_memory", return_value=None):
+            self.assertEqual(
+                Sorter.default_max_bytes_in_ram(), Sorter.DefaultMaxBytesInRam
+            )
+        with mock.patch("maflib.sorter._available_memory", return_value=1 << 20):
+            self.assertEqual(
+                Sorter.default_max_bytes_in_ram(), Sorter.DefaultMaxBytesInRam
+            )
+        with mock.patch("maflib.sorter._available_memory", return_value=16 << 30):
+            self.assertEqual(Sorter.default_max_bytes_in_ram(), 4 << 30)
+
+    def test_spilling_to_disk_small_blocks(self):
+        num_records = 100
+        sorter = Sorter(
+            10,
+            self.codec(),
+            BarcodesAndCoordinate().sort_key(),
+            spill_block_bytes=1,
+        )
+        for i in range(num_records):
+            sorter += DummyRecord("A", "B", "C", 1, num_records - i - 1)
+        records = [r for r in sorter]
+        sorter.close()
+        self.assertListEqual(
+            [r.value("End_Position") for r in records], list(range(num_records))
+        )
+
+    def test_spilling_to_disk_with_merges(self):
+        num_records = 1000
+        sorter = Sorter(10, self.codec(), BarcodesAndCoordinate().sort_key())
+        for i in range(num_records):
+            sorter += DummyRecord("A", "B", "C", 1, num_records - i - 1)
+        with mock.patch("maflib.sorter._MAX_MERGE_FAN_IN", 3):
+            records = [r for r in sorter]
+        self.assertLessEqual(len(sorter._spills), 3)
+        sorter.close()
+        self.assertListEqual(
+            [r.value("End_Position") for r in records], list(range(num_records))
+        )
+
+    def test_merges_only_as_many_spills_as_needed(self):
+        num_records = 33
+        sorter = Sorter(1, self.codec(), Coordinate().sort_key())
+        # NB: the keys are all equal, so the records are returned in the order
+        # they were added
+        for i in range(num_records):
+            sorter += DummyRecord(str(i), "B", "C", 1, 1)
+        self.assertEqual(len(sorter._spills), num_records)
+        merge_spills = Sorter._Sorter__merge_spills
+        with mock.patch("maflib.sorter._MAX_MERGE_FAN_IN", 32), mock.patch.object(
+            Sorter, "_Sorter__merge_spills", autospec=True, side_effect=merge_spills
+        ) as merges:
+            records = [r for r in sorter]
+        sorter.close()
+        # 33 spills are brought down to 32 by merging the 2 oldest
+        self.assertListEqual([c.args[1] for c in merges.call_args_list], [2])
+        self.assertListEqual(
+            [r.value("Tumor_Sample_Barcode") for r in records],
+            [str(i) for i in range(num_records)],
+        )
+
+    def test_tmp_files_have_no_names(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sorter = Sorter(
+                10, self.codec(), BarcodesAndCoordinate().sort_key(), tmp_dir=tmp_dir
+            )
+            for i in range(100):
+                sorter += DummyRecord("A", "B", "C", 1, i)
+            self.assertTrue(len(sorter._spills) > 1)
+            self.assertListEqual(os.listdir(tmp_dir), [])
+            sorter.close()
+
+    def test_spilling_to_disk_partial(self):
+        self.__test_spilling_to_disk(num_records=250, always_spill=False)
+
+    def test_truncated_tmp_file(self):
+        sorter = Sorter(100, self.codec(), BarcodesAndCoordinate().sort_key())
+        for i in range(10):
+            sorter += DummyRecord("A", "B", "C", 1, i)
+        sorter._Sorter__spill()
+        sorter._Sorter__wait_for_spill_writes()
+        spill = sorter._spills[0]
+        spill.seek(0)
+        with _open_spill_for_reading(spill, sorter._compression) as handle:
+            data = handle.read()
+        spill.seek(0)
+        spill.truncate()
+        with _open_spill_for_writing(spill, sorter._compression) as handle:
+            handle.write(data[:-1])
+        with self.assertRaises(IOError):
+            [r for r in sorter]
+        sorter.close()
+
+    def test_keys_spilled_as_tuples(self):
+        sorter = Sorter(100, self.codec(), BarcodesAndCoordinate().sort_key())
+        sorter += DummyRecord("A", "B", "C", 1, 2)
+        sorter._Sorter__spill()
+        sorter._Sorter__wait_for_spill_writes()
+        entries = list(_read_sorted(sorter._spills[0], sorter._compression))
+        sorter.close()
+        self.assertEqual(len(entries), 1)
+        self.assertIs(type(entries[0][0]), tuple)
+        self.assertEqual(entries[0][0], ("A", "B", "C", 1, 2))
+
+    def test_equal_keys_spilled_together(self):
+        sorter = Sorter(100, self.codec(), BarcodesAndCoordinate().sort_key())
+        for i in range(10):
+            sorter += DummyRecord("A", "B", "C", 1, 1 - i // 5)
+        sorter._Sorter__spill()
+        sorter._Sorter__wait_for_spill_writes()
+        entries = list(_read_sorted(sorter._spills[0], sorter._compression))
+        self.assertListEqual([len(datas) for _, datas in entries], [5, 5])
+        self.assertListEqual([key[-1] for key, _ in entries], [0, 1])
+        for i in range(25):
+            sorter += DummyRecord("A", "B", "C", 1, i % 3)
+        records = [r for r in sorter]
+        sorter.close()
+        self.assertListEqual(
+            [r.value("End_Position") for r in records],
+            [0] * 14 + [1] * 13 + [2] * 8,
+        )
+
+    def test_iterate_twice(self):
+        sorter = Sorter(10, self.codec(), BarcodesAndCoordinate().sort_key())
+        for i in range(25):
+            sorter += DummyRecord("A", "B", "C", 1, 24 - i)
+        first = [r.value("End_Position") for r in sorter]
+        second = [r.value("End_Position") for r in sorter]
+        sorter.close()
+        self.assertListEqual(first, list(range(25)))
+        self.assertListEqual(second, first)
+
+    def test_packed_coordinate_keys(self):
+        keys = [(1, 2, 3), (0, 5, 1), (1, 2, 2), (0, 1 << 39, 0)]
+        packed = _packed_coordinate_keys(keys)
+        self.assertEqual(
+            sorted(range(len(keys)), key=packed.__getitem__),
+            sorted(range(len(keys)), key=keys.__getitem__),
+        )
+        self.assertIsNone(_packed_coordinate_keys([("A", 1, 2)]))
+        self.assertIsNone(_packed_coordinate_keys([(1, 2, 3), (1, None, 3)]))
+        self.assertIsNone(_packed_coordinate_keys([(1, 2, 3), (1, -1, 3)]))
+        self.assertIsNone(_packed_coordinate_keys([(1, 2, 3), (1, 1 << 40, 3)]))
+        self.assertIsNone(_packed_coordinate_keys([(1, 2, 3), (1, 2, -3)]))
+        self.assertIsNone(_packed_coordinate_keys([(1, 2, 3), (1, 2, 1 << 40)]))
+        self.assertIsNone(_packed_coordinate_keys([(1, 2, 3), (-1, 2, 3)]))
+        self.assertIsNone(_packed_coordinate_keys([(1, 2, 3), ("A", "B", 1, 2, 3)]))
+
+    def test_coordinate_with_contigs(self):
+        num_records = 99
+        sorter = Sorter(
+            100,
+            self.codec(),
+            Coordinate(contigs=["D", "C"]).sort_key(),
+            always_spill=False,
+        )
+        for i in range(num_records):
+            sorter += DummyRecord("A", "B", "CD"[i % 2], 1, num_records - i - 1)
+        records = [r for r in sorter]
+        sorter.close()
+        self.assertListEqual(
+            [r.value("Chromosome") for r in records], ["D"] * 49 + ["C"] * 50
+        )
+        self.assertListEqual(
+            [r.value("End_Position") for r in records],
+            list(range(1, num_records, 2)) + list(range(0, num_records, 2)),
+        )
+
+    def __test_spilling_to_disk(
+        self, num_records=1000, always_spill=True, compression=None
+    ):
         max_objects_in_ram = 100
-        num_records = max_objects_in_ram * 10
         sorter = Sorter(
             max_objects_in_ram,
             self.codec(),
             BarcodesAndCoordinate().sort_key(),
-            always_spill=True,
+            always_spill=always_spill,
+            compression=compression,
         )
 
         # add them in reverse order
@@ -211,5 +523,38 @@ class TestMafSorter(unittest.TestCase):
         fd.close()
         os.remove(fn)
 
+    def test_sorter_with_no_normal_barcode(self):
+        class TumorOnlyScheme(DummyScheme):
+            @classmethod
+            def __column_dict__(cls):
+                column_dict = DummyScheme.__column_dict__()
+                column_dict["Matched_Norm_Sample_Barcode"] = NullableStringColumn
+                return column_dict
+
+        scheme = TumorOnlyScheme()
+        lines = ["A\tB\tC\t1\t2", "A\t\tC\t1\t1", "A\tB\tC\t1\t1", "A\t\tC\t1\t3"]
+
+        # records without a normal barcode are sorted after those with one, both
+        # in memory and when spilled to disk
+        for max_objects_in_ram in (100, 2):
+            with self.subTest(max_objects_in_ram=max_objects_in_ram):
+                sorter = MafSorter(
+                    sort_order_name=BarcodesAndCoordinate.name(),
+                    scheme=scheme,
+                    max_objects_in_ram=max_objects_in_ram,
+                )
+                for line in lines:
+                    sorter += MafRecord.from_line(line=line, scheme=scheme)
+                self.assertListEqual(
+                    [str(record) for record in sorter],
+                    [
+                        "A\tB\tC\t1\t1",
+                        "A\tB\tC\t1\t2",
+                        "A\t\tC\t1\t1",
+                        "A\t\tC\t1\t3",
+                    ],
+                )
+                sorter.close()
+
 
 # __END__
@@ -1,7 +1,14 @@
 import os
 import unittest
+from io import StringIO
 
-from maflib.util import LineReader, PeekableIterator, extend_class, extend_instance
+from maflib.util import (
+    LineReader,
+    PeekableIterator,
+    captured_output,
+    extend_class,
+    extend_instance,
+)
 from tests.maflib.testutils import tmp_file
 
 
@@ -45,12 +52,25 @@ class TestLineReader(unittest.TestCase):
         reader.close()
         os.remove(fn)
 
+    def test_lazy_first_line(self):
+        fh = StringIO("first\nsecond\n")
+        reader = LineReader(fh=fh)
+        self.assertEqual(fh.tell(), 0)
+        self.assertEqual(reader.peek_line(), "first")
+        self.assertListEqual([line for line in reader], ["first", "second"])
+
 
 class TestPeekableIterator(unittest.TestCase):
     def test_simple_iteration(self):
         items = [i for i in range(10)]
         self.assertListEqual(items, [item for item in PeekableIterator(iter(items))])
 
+    def test_none_elements(self):
+        items = PeekableIterator(iter([None, 1, None]))
+        self.assertIsNone(items.peek())
+        self.assertListEqual([item for item in items], [None, 1, None])
+        self.assertIsNone(items.peek())
+
     def test_peek(self):
         items = PeekableIterator(iter([i for i in range(10)]))
 
@@ -75,6 +95,7 @@ class TestMisc(unittest.TestCase):
         cls = extend_class(base_cls, TestMisc.World)
         self.assertEqual(str(base_cls()), "hello")
         self.assertEqual(str(cls()), "world")
+        self.assertIs(extend_class(base_cls, TestMisc.World), cls)
 
     def test_extend_instance(self):
         base_cls = TestMisc.Hello
@@ -82,3 +103,11 @@ class TestMisc(unittest.TestCase):
         self.assertEqual(str(obj), "hello")
         extend_instance(obj, TestMisc.World)
         self.assertEqual(str(obj), "world")
+
+    def test_captured_output(self):
+        with captured_output() as (stdout, stderr):
+            print("hello")
+        self.assertEqual(stdout.getvalue(), "hello\n")
+        with captured_output(discard=True) as (stdout, stderr):
+            print("hello")
+            self.assertEqual(stdout.write("world"), 5)
@@ -2,6 +2,7 @@
 
 import tempfile
 from collections import OrderedDict
+from unittest import mock
 
 from maflib.column_types import FloatColumn, IntegerColumn, StringColumn
 from maflib.header import MafHeader
@@ -88,7 +89,7 @@ class TestMafWriter(TestCase):
         )
 
         #  Exceptions
-        with captured_output():
+        with captured_output(discard=True):
             with self.assertRaises(MafFormatException) as context:
                 writer = MafWriter.from_path(
                     path=path,
@@ -123,6 +124,12 @@ class TestMafWriter(TestCase):
         self.assertListEqual(stdout, [''])
         self.assertListEqual(stderr, [''])
 
+        # a lower compression level
+        with captured_output(discard=True):
+            writer = MafWriter.from_path(header=header, path=path, compresslevel=1)
+            writer.close()
+            self.assertListEqual(read_lines(path), lines)
+
     def test_close(self):
         fd, path = tempfile.mkstemp()
 
@@ -216,6 +223,32 @@ class TestMafWriter(TestCase):
             read_lines(path), header_lines + [err_record_line, err_record_line]
         )
 
+    def test_records_not_validated_when_silent(self):
+        class NoValidateRecord(TestMafWriter.DummyRecord):
+            def validate(self, *args, **kwargs):
+                raise Exception("Records should not be validated when silent")
+
+        scheme = TestMafWriter.TestCoordinateScheme()
+        fd, path = tempfile.mkstemp()
+
+        header = MafHeader.from_lines(
+            lines=MafHeader.scheme_header_lines(scheme),
+            validation_stringency=ValidationStringency.Silent,
+        )
+        writer = MafWriter.from_path(
+            header=header,
+            validation_stringency=ValidationStringency.Silent,
+            path=path,
+        )
+        writer += NoValidateRecord("chr1", 2, 2)
+        writer.close()
+
+        self.assertListEqual(
+            read_lines(path),
+            MafHeader.scheme_header_lines(scheme)
+            + ["\t".join(scheme.column_names()), "chr1\t2\t2"],
+        )
+
     class TestCoordinateScheme(MafScheme):
         @classmethod
         def version(cls):
@@ -255,11 +288,8 @@ class TestMafWriter(TestCase):
         def __str__(self):
             return "\t".join([str(v) for v in self._dict.values()])
 
-    def test_with_sorting(self):
-        scheme = TestMafWriter.TestCoordinateScheme()
-        fd, path = tempfile.mkstemp()
-
-        # Create the header
+    def __sorted_header(self, scheme):
+        """Creates the header lines and header for a coordinate sorted MAF"""
         header_lines = (
             MafHeader.scheme_header_lines(scheme)
             + ["#key1 value1", "#key2 value2"]
@@ -276,6 +306,14 @@ class TestMafWriter(TestCase):
         header = MafHeader.from_lines(
             lines=header_lines, validation_stringency=ValidationStringency.Silent
         )
+        return header_lines, header
+
+    def test_with_sorting(self):
+        scheme = TestMafWriter.TestCoordinateScheme()
+        fd, path = tempfile.mkstemp()
+
+        # Create the header
+        _, header = self.__sorted_header(scheme)
 
         # Write the header, and the record twice
         writer = MafWriter.from_path(
@@ -299,5 +337,31 @@ class TestMafWriter(TestCase):
         self.assertListEqual([r["Start_Position"].value for r in records], [2, 3, 4])
         self.assertListEqual([r["End_Position"].value for r in records], [2, 3, 4])
 
+    def test_with_sorting_in_batches(self):
+        scheme = TestMafWriter.TestCoordinateScheme()
+        fd, path = tempfile.mkstemp()
+
+        # Create the header
+        header_lines, header = self.__sorted_header(scheme)
+
+        # Write the records in reverse order, in many small batches
+        writer = MafWriter.from_path(
+            header=header,
+            validation_stringency=ValidationStringency.Lenient,
+            path=path,
+            assume_sorted=False,
+        )
+        for position in range(10, 0, -1):
+            writer += TestMafWriter.DummyRecord("chr1", position, position)
+        with mock.patch("maflib.writer._SORTED_WRITE_BATCH_SIZE", 3), mock.patch(
+            "maflib.writer._MAX_PENDING_SORTED_WRITES", 1
+        ):
+            writer.close()
+
+        self.assertListEqual(
+            read_lines(path),
+            header_lines + ["chr1\t%d\t%d" % (p, p) for p in range(1, 11)],
+        )
+
 
 # __END__